@@ -1,14 +1,52 @@
+import asyncio
+from functools import cached_property
+import hashlib
+from typing import List, Optional, Tuple
+
 from agno.agent import Agent, RunResponse
 from agno.models.google import Gemini
+from google.genai.types import Content, InlinedRequest, JobState, Part
 
 from exceptions.exceptions import AgentException
+from tools._http import GEMINI_CLIENT_PARAMS
 from models.report_results import ReportResults
 from prompts.report_analyze_agent_prompt import (
     DESCRIPTION_TEMP,
     ADDITIONAL_CONTEXT_TEMP,
     INSTRUCTIONS_TEMP,
+    CHUNK_PROMPT_PREFIX,
+    BATCH_PROMPT_PREFIX,
 )
 
+# Seconds between two checks of a Batch API job
+BATCH_POLL_SECONDS = 30
+
+# Batch API job states after which the job makes no more progress
+_BATCH_DONE_STATES = {
+    JobState.JOB_STATE_SUCCEEDED,
+    JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    JobState.JOB_STATE_FAILED,
+    JobState.JOB_STATE_CANCELLED,
+    JobState.JOB_STATE_EXPIRED,
+}
+
+
+async def wait_for_batch_job(client, job):
+    """
+    Polls a Gemini Batch API job until it makes no more progress.
+
+    Args:
+        client: The Gemini client that created the job.
+        job: The job, as returned by the Batch API.
+
+    Returns:
+        The job in its final state.
+    """
+    while job.state not in _BATCH_DONE_STATES:
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        job = await client.aio.batches.get(name=job.name)
+    return job
+
 
 class ReportAnalyzeAgent:
 
@@ -18,6 +56,7 @@ class ReportAnalyzeAgent:
             model=Gemini(
                 id="gemini-2.5-flash",
                 temperature=0.0,
+                client_params=GEMINI_CLIENT_PARAMS,
             ),
             description=DESCRIPTION_TEMP,
             instructions=INSTRUCTIONS_TEMP,
@@ -30,6 +69,21 @@ class ReportAnalyzeAgent:
             delay_between_retries=30,  # Timeout of 30 seconds
         )
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 of the model settings and prompts, which change what an analysis returns."""
+        model: Gemini = self.agent.model
+        parts = (
+            model.id,
+            str(model.temperature),
+            DESCRIPTION_TEMP,
+            INSTRUCTIONS_TEMP,
+            ADDITIONAL_CONTEXT_TEMP,
+            CHUNK_PROMPT_PREFIX,
+            BATCH_PROMPT_PREFIX,
+        )
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
     async def analyze_chunk_async(
         self, chunk_index: int, chunk_text: str
     ) -> ReportResults:
@@ -44,19 +98,116 @@ class ReportAnalyzeAgent:
             ReportResults: The results of the analysis.
         """
 
-        chunk_prompt = f""" 
-            Please analyze this chunk of the corporate governance report:
-            
-            **CHUNK {chunk_index}**:
-            \"\"\"
-            {chunk_text}
-            \"\"\"
-            
-            **OUTPUT**:
-            """
+        chunk_prompt = (
+            f"{CHUNK_PROMPT_PREFIX}**CHUNK {chunk_index}**:\n"
+            f'"""\n{chunk_text}\n"""\n\n'
+            "**OUTPUT**:\n"
+        )
+
+        return await self._analyze_async(chunk_prompt)
+
+    async def analyze_chunks_async(
+        self, chunks: List[Tuple[int, str]]
+    ) -> ReportResults:
+        """
+        Search for the insiders and governance data in several chunks with a single request.
+
+        Args:
+            chunks (List[Tuple[int, str]]): The index and text of each chunk.
+
+        Returns:
+            ReportResults: The results of the analysis of all the chunks.
+        """
+        if len(chunks) == 1:
+            return await self.analyze_chunk_async(*chunks[0])
+
+        return await self._analyze_async(self._get_batch_prompt(chunks))
+
+    async def analyze_chunks_batch(
+        self, batches: List[List[Tuple[int, str]]]
+    ) -> List[Optional[ReportResults]]:
+        """
+        Analyzes all the batches of chunks with a single Gemini Batch API job.
+
+        The job costs half as much as the same requests sent one by one and is not
+        subject to the per-minute rate limits, but it can take minutes to complete.
+
+        Args:
+            batches (List[List[Tuple[int, str]]]): The index and text of the chunks of each request.
+
+        Returns:
+            List[Optional[ReportResults]]: The results of each request, in input order,
+            or None for the requests that failed.
+        """
+        model: Gemini = self.agent.model
+        try:
+            system_message = self.agent.get_system_message(
+                session_id=self.agent.session_id or ""
+            )
+            request_params = model.get_request_params(
+                system_message=system_message.content if system_message else None
+            )
+            # Same JSON mode as the agent runs
+            config = request_params["config"].model_copy(
+                update={"response_mime_type": "application/json"}
+            )
+            requests = [
+                InlinedRequest(
+                    contents=[
+                        Content(role="user", parts=[Part(text=self._get_batch_prompt(chunks))])
+                    ],
+                    config=config,
+                )
+                for chunks in batches
+            ]
+
+            client = model.get_client()
+            job = await client.aio.batches.create(model=model.id, src=requests)
+            job = await wait_for_batch_job(client, job)
+        except Exception as e:
+            message = f"Error in {self.agent.name} batch job."
+            raise AgentException(message) from e
 
+        if job.dest is None or not job.dest.inlined_responses:
+            message = f"Batch job {job.name} ended in state {job.state} without responses."
+            raise AgentException(message)
+
+        results: List[Optional[ReportResults]] = []
+        for inlined in job.dest.inlined_responses:
+            try:
+                results.append(ReportResults.model_validate_json(inlined.response.text))
+            except Exception:
+                results.append(None)
+        return results
+
+    def _get_batch_prompt(self, chunks: List[Tuple[int, str]]) -> str:
+        """
+        Builds the prompt to analyze several chunks with a single request.
+
+        Args:
+            chunks (List[Tuple[int, str]]): The index and text of each chunk.
+
+        Returns:
+            str: The prompt.
+        """
+        sections = "".join(
+            f'**CHUNK {chunk_index}**:\n"""\n{chunk_text}\n"""\n\n'
+            for chunk_index, chunk_text in chunks
+        )
+        return f"{BATCH_PROMPT_PREFIX}{sections}**OUTPUT**:\n"
+
+    async def _analyze_async(self, prompt: str) -> ReportResults:
+        """
+        Runs the agent on a prompt and checks the response.
+
+        Args:
+            prompt (str): The prompt with the chunks to analyze.
+
+        Returns:
+            ReportResults: The results of the analysis.
+        """
         try:
-            response: RunResponse = await self.agent.arun(chunk_prompt, stream=False)
+            response: RunResponse = await self.agent.arun(prompt, stream=False)
         except Exception as e:
             message = f"Error in {self.agent.name}."
             raise AgentException(message) from e
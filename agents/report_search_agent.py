@@ -5,6 +5,7 @@ from agno.tools.googlesearch import GoogleSearchTools
 from agno.tools.reasoning import ReasoningTools
 
 from exceptions.exceptions import AgentException
+from tools._http import GEMINI_CLIENT_PARAMS
 from tools.crawl import CrawlTools
 
 from models.report import Report
@@ -39,6 +40,7 @@ class ReportSearchAgent:
                 id="gemini-2.5-flash",
                 temperature=0.1,
                 top_p=0.95,
+                client_params=GEMINI_CLIENT_PARAMS,
             ),
             tools=[
                 GoogleSearchTools(fixed_max_results=3, cache_results=False),
@@ -1,14 +1,17 @@
+import json
+
 from agno.agent import Agent, RunResponse
 from agno.models.google import Gemini
 from agno.utils.log import logger
 
 from exceptions.exceptions import AgentException
+from tools._http import GEMINI_CLIENT_PARAMS
 from models.report_results import ReportResultsTemp
 
 from prompts.summarization_agent_prompt import (
-    DESCRIPTION,
-    INSTRUCTIONS,
-    ADDITIONAL_CONTEXT,
+    SUMMARIZATION_SYSTEM_PROMPT,
+    PROMPT_PREFIX,
+    PROMPT_SUFFIX,
 )
 
 
@@ -22,10 +25,9 @@ class SummarizationAgent:
                 id="gemini-2.5-flash",
                 temperature=0.1,
                 top_p=0.95,
+                client_params=GEMINI_CLIENT_PARAMS,
             ),
-            description=DESCRIPTION,
-            instructions=INSTRUCTIONS,
-            additional_context=ADDITIONAL_CONTEXT,
+            system_message=SUMMARIZATION_SYSTEM_PROMPT,
             use_json_mode=True,
             response_model=ReportResultsTemp,
             debug_mode=False,
@@ -45,15 +47,10 @@ class SummarizationAgent:
             ReportResultsTemp: The summarized results.
         """
 
-        prompt = f"""Please summarized and merge the following chunk results.
-        
-        **RESULTS**:
-        \"\"\"
-        {results}
-        \"\"\"
+        # Compact JSON keeps the payload smaller than the Python repr of the list
+        payload = json.dumps(results, ensure_ascii=False, separators=(",", ":"))
 
-        **OUTPUT**: 
-        """
+        prompt = f"{PROMPT_PREFIX}{payload}{PROMPT_SUFFIX}"
 
         try:
             response: RunResponse = self.agent.run(prompt, stream=False)
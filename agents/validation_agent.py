@@ -1,12 +1,16 @@
+import json
+
 from agno.agent import Agent, RunResponse
 from agno.models.google import Gemini
 
 from exceptions.exceptions import AgentException
+from tools._http import GEMINI_CLIENT_PARAMS
 from models.report_results import ReportResults
 
 from prompts.validation_agent_prompt import (
-    DESCRIPTION,
-    INSTRUCTIONS,
+    VALIDATION_SYSTEM_PROMPT,
+    PROMPT_PREFIX,
+    PROMPT_SUFFIX,
     # ADDITIONAL_CONTEXT,
 )
 
@@ -20,10 +24,9 @@ class ValidationAgent:
             model=Gemini(
                 id="gemini-2.5-flash",
                 temperature=0.0,
+                client_params=GEMINI_CLIENT_PARAMS,
             ),
-            description=DESCRIPTION,
-            instructions=INSTRUCTIONS,
-            # additional_context=ADDITIONAL_CONTEXT,
+            system_message=VALIDATION_SYSTEM_PROMPT,
             use_json_mode=True,
             response_model=ReportResults,
             debug_mode=False,
@@ -37,31 +40,71 @@ class ValidationAgent:
         Runs the agent to validate the resutlts extracted from the report.
 
         Args:
-            data (list[dict]): The data to be verified.
+            results (dict): The data to be verified.
 
         Returns:
             ReportResults: The verified data.
         """
+        try:
+            response: RunResponse = self.agent.run(
+                self._get_prompt(results), stream=False
+            )
+        except Exception as e:
+            message = f"Error in {self.agent.name}."
+            raise AgentException(message) from e
 
-        prompt = f"""Please validate the following data:
-        
-        \"\"\"
-        {results}.
-        \"\"\"
+        return self._check_response(response)
 
-        Validated Output: 
+    async def validate_results_async(self, results: dict) -> ReportResults:
         """
+        Async version of `validate_results`, it does not block the workflow's event loop.
+
+        Args:
+            results (dict): The data to be verified.
 
+        Returns:
+            ReportResults: The verified data.
+        """
         try:
-            response: RunResponse = self.agent.run(prompt, stream=False)
+            response: RunResponse = await self.agent.arun(
+                self._get_prompt(results), stream=False
+            )
         except Exception as e:
             message = f"Error in {self.agent.name}."
             raise AgentException(message) from e
 
-        if response.content is None:
-            raise AgentException(f"Missing response content.")
+        return self._check_response(response)
+
+    def _get_prompt(self, results: dict) -> str:
+        """
+        Builds the validation prompt.
+
+        Args:
+            results (dict): The data to be verified.
+
+        Returns:
+            str: The prompt.
+        """
+        # Compact JSON keeps the payload smaller than the Python repr of the dict
+        payload = json.dumps(results, ensure_ascii=False, separators=(",", ":"))
+        return f"{PROMPT_PREFIX}{payload}{PROMPT_SUFFIX}"
+
+    def _check_response(self, response: RunResponse) -> ReportResults:
+        """
+        Checks the agent response and returns its content.
+
+        Args:
+            response (RunResponse): The response of the agent.
+
+        Returns:
+            ReportResults: The verified data.
+        """
+        if response is None or response.content is None:
+            raise AgentException("Missing response content.")
 
         if not isinstance(response.content, ReportResults):
-            raise AgentException(f"Expected ReportURL, got {type(response.content)}.")
+            raise AgentException(
+                f"Expected ReportResults, got {type(response.content)}."
+            )
 
         return response.content
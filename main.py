@@ -10,8 +10,20 @@ from workflows.insiders_workflow_v2 import InsidersWorkflow
 load_dotenv()
 
 
-def main(company_name: str, report_url: str) -> None:
-    workflow = InsidersWorkflow()
+def main(
+    company_name: str,
+    report_url: str,
+    auto_confirm: bool = False,
+    save_db: bool = False,
+    save_local: bool = False,
+    use_batch_api: bool = False,
+) -> None:
+    workflow = InsidersWorkflow(
+        auto_confirm=auto_confirm,
+        save_db=save_db,
+        save_local=save_local,
+        use_batch_api=use_batch_api,
+    )
 
     try:
         response: RunResponse = workflow.run(
@@ -29,22 +41,54 @@ def main(company_name: str, report_url: str) -> None:
 
 
 if __name__ == "__main__":
-    parser = ArgumentParser()
+    parser = ArgumentParser(
+        description="Extract insiders from a company's corporate governance report."
+    )
     parser.add_argument(
         "-c",
         "--company_name",
         type=str,
         required=False,
+        help="Name of the company to process",
     )
     parser.add_argument(
         "--report_url",
         type=str,
         required=False,
         default=None,
+        help="URL of the report to analyze (skips the report search)",
+    )
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Run without prompts (results are saved only with --save-db/--save-local)",
+    )
+    parser.add_argument(
+        "--save-db",
+        action="store_true",
+        help="Save the results to the database without asking",
+    )
+    parser.add_argument(
+        "--save-local",
+        action="store_true",
+        help="Save the results locally without asking",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Analyze the report with a single Gemini Batch API job (cheaper, slower)",
     )
 
     args = parser.parse_args()
     if not args.company_name and not args.report_url:
         parser.error("At least one of --company_name or --report_url must be provided.")
 
-    main(args.company_name, args.report_url)
+    main(
+        args.company_name,
+        args.report_url,
+        auto_confirm=args.yes,
+        save_db=args.save_db,
+        save_local=args.save_local,
+        use_batch_api=args.batch,
+    )
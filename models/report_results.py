@@ -1,4 +1,5 @@
-from typing import Optional, List
+import re
+from typing import Dict, Optional, List
 from pydantic import BaseModel, Field
 
 
@@ -26,6 +27,97 @@ class ReportResults(BaseModel):
     edges: List[Edge] = Field(default=[])
 
 
+# Edge property renames from the legacy Person schema to the Insider schema
+_LEGACY_EDGE_PROPERTIES = {
+    "HOLDS_POSITION": {"position_title": "title", "from": "startDate", "to": "endDate"},
+    "MEMBER_OF": {"type": "role", "from": "startDate", "to": "endDate"},
+}
+
+_YEAR = re.compile(r"\d{4}")
+
+
+def _upgrade_audited_by(properties: dict) -> dict:
+    """Replace the legacy {from, to} audit period with the fiscalYear it covers."""
+    properties = dict(properties)
+    years = [
+        match.group()
+        for value in (properties.pop("from", None), properties.pop("to", None))
+        if value and (match := _YEAR.search(str(value)))
+    ]
+    if years and "fiscalYear" not in properties:
+        properties["fiscalYear"] = "-".join(dict.fromkeys(years))
+    return properties
+
+
+def upgrade_person_to_insider(graph: dict) -> dict:
+    """
+    Converts a graph using the legacy Person schema to the Insider schema.
+
+    Person nodes become Insider nodes (name split into firstName/lastName, IDs moved
+    to the "insider_" prefix), the edge properties are renamed accordingly and the
+    AUDITED_BY {from, to} period becomes a fiscalYear. Nodes and edges already in
+    the Insider schema are kept as they are.
+
+    Args:
+        graph (dict): A graph with "nodes" and "edges" lists.
+
+    Returns:
+        dict: The upgraded graph.
+    """
+    id_map: Dict[str, str] = {}
+    nodes = []
+    for node in graph.get("nodes", []):
+        if node.get("label") != "Person":
+            nodes.append(node)
+            continue
+
+        properties = dict(node.get("properties", {}))
+        name = (properties.pop("name", None) or "").strip()
+        first_name, _, last_name = name.partition(" ")
+        properties.setdefault("firstName", first_name)
+        properties.setdefault("lastName", last_name)
+
+        node_id = node.get("id", "")
+        suffix = node_id[len("person_") :] if node_id.startswith("person_") else node_id
+        id_map[node_id] = "insider_" + suffix
+
+        nodes.append(
+            {
+                **node,
+                "id": id_map[node_id],
+                "label": "Insider",
+                "properties": properties,
+            }
+        )
+
+    edges = []
+    for edge in graph.get("edges", []):
+        source = edge.get("source", "")
+        dest = edge.get("dest", "")
+        properties = edge.get("properties", {})
+        if edge.get("type") == "AUDITED_BY":
+            properties = _upgrade_audited_by(properties)
+        elif source in id_map:
+            renames = _LEGACY_EDGE_PROPERTIES.get(edge.get("type", ""), {})
+            if "president" in properties:
+                properties = dict(properties)
+                president = properties.pop("president")
+                properties.setdefault(
+                    "role", "Chairman" if str(president).lower() == "true" else "Member"
+                )
+            properties = {renames.get(k, k): v for k, v in properties.items()}
+        edges.append(
+            {
+                **edge,
+                "source": id_map.get(source, source),
+                "dest": id_map.get(dest, dest),
+                "properties": properties,
+            }
+        )
+
+    return {**graph, "nodes": nodes, "edges": edges}
+
+
 ####################### Unused ###########################
 
 
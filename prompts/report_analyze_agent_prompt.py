@@ -1,3 +1,4 @@
+import sys
 from textwrap import dedent
 
 
@@ -306,6 +307,20 @@ ADDITIONAL_CONTEXT_TEMP = dedent(
     """
 )
 
+CHUNK_PROMPT_PREFIX = (
+    "Please analyze this chunk of the corporate governance report:\n\n"
+)
+
+BATCH_PROMPT_PREFIX = (
+    "Please analyze these consecutive chunks of the corporate governance report "
+    "and return a single output covering all of them:\n\n"
+)
+
+# Intern the prompts so every agent instance shares the same string objects
+DESCRIPTION_TEMP = sys.intern(DESCRIPTION_TEMP)
+INSTRUCTIONS_TEMP = sys.intern(INSTRUCTIONS_TEMP)
+ADDITIONAL_CONTEXT_TEMP = sys.intern(ADDITIONAL_CONTEXT_TEMP)
+
 ############################# Unused ##################################
 
 SCHEMA_TEMP = dedent(
@@ -23,7 +23,7 @@ INSTRUCTIONS = dedent(
     """
     - Compose a search query that includes the company name and the term "governo societario". DO NOT include filetype:pdf at first search.
     - Use **google_search** tool to search the web for the query.
-    - Use **crawl** tool to crawl web pages.
+    - Use **crawl** tool to crawl web pages. To crawl several pages, pass all their URLs as a list in a single call.
     - If available, crawl company's official website to verify the report's authenticity and recency. It is very important.
     - If you find multiple reports, select the most recent one.
     - If you cannot find a corporate governance report, search for a "financial report" or "annual report" as an alternative.
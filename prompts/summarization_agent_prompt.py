@@ -1,3 +1,4 @@
+import os
 from textwrap import dedent
 
 
@@ -72,7 +73,8 @@ INSTRUCTIONS = dedent(
     """
 )
 
-ADDITIONAL_CONTEXT = dedent(
+# Full example, sent only when VERBOSE_PROMPTS is set (useful for debugging)
+ADDITIONAL_CONTEXT_FULL = dedent(
     """
     OUPUT EXAMPLE:
     ```json
@@ -320,3 +322,45 @@ ADDITIONAL_CONTEXT = dedent(
     ```
     """
 )
+
+# Compact example: one node per label and one edge per type is enough structural guidance
+ADDITIONAL_CONTEXT_COMPACT = dedent(
+    """
+    OUPUT EXAMPLE:
+    ```json
+    {
+      "nodes": [
+        {"id": "company_ferrari", "label": "Company", "properties": {"name": "Ferrari N.V.", "isin": "NL0011585146", "ticker": "RACE", "vatNumber": ""}},
+        {"id": "address_maranello", "label": "Address", "properties": {"street": "Via Abetone Inferiore, 4", "city": "Maranello", "postalCode": "41053", "country": "Italy"}},
+        {"id": "auditor_ey", "label": "Auditor", "properties": {"name": "EY S.p.A."}},
+        {"id": "shareholder_exor", "label": "Shareholder", "properties": {"name": "Exor N.V."}},
+        {"id": "board_of_directors_ferrari", "label": "Board", "properties": {"type": "board of directors"}},
+        {"id": "committee_control_and_risks_ferrari", "label": "Committee", "properties": {"name": "Control and Risks Committee"}},
+        {"id": "insider_benedetto_vigna", "label": "insider", "properties": {"firstName": "Benedetto", "lastName": "Vigna", "dateOfBirth": "1969-04-10", "cityOfBirth": "", "taxCode": ""}}
+      ],
+      "edges": [
+        {"source": "board_of_directors_ferrari", "type": "PART_OF", "dest": "company_ferrari", "properties": {}},
+        {"source": "company_ferrari", "type": "LOCATED_AT", "dest": "address_maranello", "properties": {}},
+        {"source": "company_ferrari", "type": "AUDITED_BY", "dest": "auditor_ey", "properties": {"fiscalYear": "2024"}},
+        {"source": "shareholder_exor", "type": "OWNS_SHARES_IN", "dest": "company_ferrari", "properties": {"percentage": 24.65}},
+        {"source": "insider_benedetto_vigna", "type": "HOLDS_POSITION", "dest": "company_ferrari", "properties": {"title": "CEO", "startDate": "2021-09-01", "endDate": ""}},
+        {"source": "insider_benedetto_vigna", "type": "MEMBER_OF", "dest": "board_of_directors_ferrari", "properties": {"role": "Executive Director", "startDate": "2021-09-01", "endDate": ""}}
+      ]
+    }
+    ```
+    """
+)
+
+ADDITIONAL_CONTEXT = (
+    ADDITIONAL_CONTEXT_FULL
+    if os.environ.get("VERBOSE_PROMPTS")
+    else ADDITIONAL_CONTEXT_COMPACT
+)
+
+PROMPT_PREFIX = 'Please summarized and merge the following chunk results.\n\n**RESULTS**:\n"""\n'
+
+PROMPT_SUFFIX = '\n"""\n\n**OUTPUT**:\n'
+
+# Static system prompt, built once so every request starts with the same prefix
+# and can hit the provider's prompt cache
+SUMMARIZATION_SYSTEM_PROMPT = "\n".join((DESCRIPTION, INSTRUCTIONS, ADDITIONAL_CONTEXT))
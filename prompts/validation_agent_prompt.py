@@ -1,5 +1,8 @@
 from textwrap import dedent
 
+# Bump when the node/edge schema below changes
+SCHEMA_VERSION = "v2"
+
 DESCRIPTION = dedent(
     """
     You are an agent specialized in corporate governance and knowledge graph creation.
@@ -9,19 +12,22 @@ DESCRIPTION = dedent(
     SCHEMA
         - Nodes:
             - Company(name, isin, ticker, vatNumber)
-            - Person(name, dateOfBirth, cityOfBirth, taxCode)
+            - Insider(firstName, lastName, dateOfBirth, cityOfBirth, taxCode)
             - Board(type)  // type must be "board of directors" or "board of statutory auditors"
             - Committee(name)
             - Auditor(name)
+            - Shareholder(name)
             - Address(street, city, postalCode, country)
         - Edges:
-            - (:Person)-[:HOLDS_POSITION {position_title: string, from: string, to: string}]->(:Company)
-            - (:Person)-[:MEMBER_OF {type: string, from: string, to: string}]->(:Board)
-            - (:Person)-[:MEMBER_OF {president: string, from: string, to: string}]->(:Committee) // president should be "true" or "false"
+            - (:Insider)-[:HOLDS_POSITION {title: string, startDate: string, endDate: string}]->(:Company)
+            - (:Insider)-[:MEMBER_OF {role: string, startDate: string, endDate: string}]->(:Board)
+            - (:Insider)-[:MEMBER_OF {role: string, startDate: string, endDate: string}]->(:Committee)
+            - (:Insider)-[:REPRESENTS {title: string, startDate: string, endDate: string}]->(:Authority)
             - (:Board)-[:PART_OF]->(:Company)
             - (:Committee)-[:PART_OF]->(:Company)
             - (:Company)-[:LOCATED_AT]->(:Address)
-            - (:Company)-[:AUDITED_BY {from: string, to: string}]->(:Auditor)
+            - (:Company)-[:AUDITED_BY {fiscalYear: string}]->(:Auditor)
+            - (:Shareholder)-[:OWNS_SHARES_IN {percentage: float}]->(:Company)
     """
 )
 
@@ -30,8 +36,8 @@ INSTRUCTIONS = dedent(
     - All nodes and edges must conform to the SCHEMA. Remove properties that are not part of the SCHEMA.
     - Merge nodes that refer to the same entity, base the comparison on the available properties and the IDs. The output node must contain all the unique properties of the merged nodes.
     - Merge duplicate edges, base the comparison on the available properties, source and target node IDs, and edge type. The output edge must contain all the unique properties of the merged edges.
-    - Remove redundant edges, preserve the most specific. E.g., if a Person is linked to a Board with a MEMBER_OF edge and type property "Chairman", and another edge to the same Board with a MEMBER_OF edge and type property "Non-Executive Director", remove the second edge.
-    - Remove all Committee nodes that are not linked to any Person.
+    - Remove redundant edges, preserve the most specific. E.g., if an Insider is linked to a Board with a MEMBER_OF edge and role property "Chairman", and another edge to the same Board with a MEMBER_OF edge and role property "Non-Executive Director", remove the second edge.
+    - Remove all Committee nodes that are not linked to any Insider.
     - Remove nodes with no edges.
     - Ensure all date properties are in the format "DD-MM-YYYY" (day-month-year). Partial dates are acceptable (e.g., "YYYY" or "MM-YYYY").
     - Keep english versions of entities if multiple languages are present (e.g., "Control and Risk Committee" vs "Comitato per il Controllo e i Rischi").
@@ -43,11 +49,12 @@ ADDITIONAL_CONTEXT = dedent(
     """
     ID CHECKS:
         - Every node must have a unique ID, based on its type and properties.
-        - Person: "person_<name>" where <name> is the full name in lowercase with underscores instead of spaces. E.g., "person_john_doe"
+        - Insider: "insider_<firstName>_<lastName>" in lowercase with underscores instead of spaces. E.g., "insider_john_doe"
         - Company: "company_<name>"
         - Board: "<type>_<companyName>" where type is "board_of_directors" or "board_of_statutory_auditors"
         - Committee: "committee_<name>_<companyName>" where <name> does not include the word "committee". E.g. "committee_control_and_risk_leonardo"
         - Auditor: "auditor_<name>"
+        - Shareholder: "shareholder_<name>"
         - Address: "address_<city>_<street>" where <street> is the street name without spaces or special characters. E.g., "address_maranello_via_abetone_inferiore_4"
         - IDs must be in lower case and use underscore separation.
         - IDs must omit legal suffixes (e.g., "SpA", "spa", "plc", "Inc.", "nv", "N.V.") in company/auditor IDs.
@@ -56,3 +63,11 @@ ADDITIONAL_CONTEXT = dedent(
         - Adjust IDs if necessary.
 """
 )
+
+PROMPT_PREFIX = 'Please validate the following data:\n\n"""\n'
+
+PROMPT_SUFFIX = '\n"""\n\nValidated Output:\n'
+
+# Static system prompt, built once so every request starts with the same prefix
+# and can hit the provider's prompt cache
+VALIDATION_SYSTEM_PROMPT = "\n".join((DESCRIPTION, INSTRUCTIONS))
@@ -0,0 +1,101 @@
+import pytest
+
+from models.report_results import upgrade_person_to_insider
+
+
+def _legacy_graph(person_id: str, name) -> dict:
+    return {
+        "nodes": [
+            {"id": person_id, "label": "Person", "properties": {"name": name}},
+            {"id": "board_of_directors_acme", "label": "Board", "properties": {}},
+            {"id": "committee_audit_acme", "label": "Committee", "properties": {}},
+            {"id": "company_acme", "label": "Company", "properties": {}},
+            {"id": "auditor_kpmg", "label": "Auditor", "properties": {}},
+        ],
+        "edges": [
+            {
+                "source": person_id,
+                "type": "MEMBER_OF",
+                "dest": "board_of_directors_acme",
+                "properties": {"type": "Chairman", "from": "01-01-2020"},
+            },
+            {
+                "source": person_id,
+                "type": "MEMBER_OF",
+                "dest": "committee_audit_acme",
+                "properties": {"president": "true"},
+            },
+            {
+                "source": "company_acme",
+                "type": "AUDITED_BY",
+                "dest": "auditor_kpmg",
+                "properties": {"from": "01-01-2023", "to": "31-12-2023"},
+            },
+        ],
+    }
+
+
+def _upgraded_graph(first_name: str, last_name: str) -> dict:
+    return {
+        "nodes": [
+            {
+                "id": "insider_john_doe",
+                "label": "Insider",
+                "properties": {"firstName": first_name, "lastName": last_name},
+            },
+            {"id": "board_of_directors_acme", "label": "Board", "properties": {}},
+            {"id": "committee_audit_acme", "label": "Committee", "properties": {}},
+            {"id": "company_acme", "label": "Company", "properties": {}},
+            {"id": "auditor_kpmg", "label": "Auditor", "properties": {}},
+        ],
+        "edges": [
+            {
+                "source": "insider_john_doe",
+                "type": "MEMBER_OF",
+                "dest": "board_of_directors_acme",
+                "properties": {"role": "Chairman", "startDate": "01-01-2020"},
+            },
+            {
+                "source": "insider_john_doe",
+                "type": "MEMBER_OF",
+                "dest": "committee_audit_acme",
+                "properties": {"role": "Chairman"},
+            },
+            {
+                "source": "company_acme",
+                "type": "AUDITED_BY",
+                "dest": "auditor_kpmg",
+                "properties": {"fiscalYear": "2023"},
+            },
+        ],
+    }
+
+
+_INSIDER_GRAPH = {
+    "nodes": [
+        {"id": "insider_jane_roe", "label": "Insider", "properties": {}},
+        {"id": "company_acme", "label": "Company", "properties": {}},
+    ],
+    "edges": [
+        {
+            "source": "insider_jane_roe",
+            "type": "HOLDS_POSITION",
+            "dest": "company_acme",
+            "properties": {"title": "CEO"},
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "graph, expected",
+    [
+        (_legacy_graph("john_doe", "John Doe"), _upgraded_graph("John", "Doe")),
+        (_legacy_graph("person_john_doe", "John Doe"), _upgraded_graph("John", "Doe")),
+        (_legacy_graph("john_doe", None), _upgraded_graph("", "")),
+        (_INSIDER_GRAPH, _INSIDER_GRAPH),
+    ],
+    ids=["unprefixed-id", "prefixed-id", "null-name", "insider-schema"],
+)
+def test_upgrade_person_to_insider(graph, expected):
+    assert upgrade_person_to_insider(graph) == expected
@@ -0,0 +1,74 @@
+import asyncio
+import atexit
+from typing import Any, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from tools import _loop
+
+# Process-wide crawlers keyed on (headless, verbose, base_directory). They are all
+# started on the shared background loop, because a Playwright browser can only be
+# driven from the loop that launched it.
+_POOL: Dict[Tuple[bool, bool, Optional[str]], AsyncWebCrawler] = {}
+_POOL_LOCK: Optional[asyncio.Lock] = None
+
+
+async def get_crawler(
+    headless: bool, verbose: bool, base_directory: Optional[str] = None
+) -> AsyncWebCrawler:
+    """
+    Return a started crawler for the given browser settings, launching it if needed.
+
+    Must be awaited on the shared background loop (see `tools._loop.run`).
+
+    Args:
+        headless (bool): Whether the browser runs headless.
+        verbose (bool): Whether Crawl4AI logs verbosely.
+        base_directory (Optional[str]): Crawl4AI base directory (cache location).
+
+    Returns:
+        AsyncWebCrawler: The shared crawler.
+    """
+    global _POOL_LOCK
+    if _POOL_LOCK is None:
+        _POOL_LOCK = asyncio.Lock()
+
+    key = (headless, verbose, base_directory)
+    async with _POOL_LOCK:
+        crawler = _POOL.get(key)
+        if crawler is None:
+            crawler_params: Dict[str, Any] = {
+                "config": BrowserConfig(headless=headless, verbose=verbose)
+            }
+            if base_directory:
+                crawler_params["base_directory"] = base_directory
+
+            crawler = AsyncWebCrawler(**crawler_params)
+            await crawler.start()
+            _POOL[key] = crawler
+            log_debug(f"Started pooled crawler for {key}")
+    return crawler
+
+
+async def _close_all() -> None:
+    while _POOL:
+        _, crawler = _POOL.popitem()
+        try:
+            await crawler.close()
+        except Exception as e:
+            log_warning(f"Error closing pooled crawler: {e}")
+
+
+@atexit.register
+def _shutdown() -> None:
+    """Close the pooled browsers at interpreter exit."""
+    if not _POOL:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_all(), _loop.get_loop()).result(
+            timeout=10
+        )
+    except Exception as e:
+        log_warning(f"Error shutting down crawler pool: {e}")
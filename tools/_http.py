@@ -0,0 +1,81 @@
+import asyncio
+import atexit
+import threading
+import weakref
+
+import httpx
+from google.genai.types import HttpOptions
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Passed as `client_params` to agno's Gemini model: the google-genai client it builds
+# then keeps an HTTP/2 keep-alive pool for every call of the agent.
+GEMINI_CLIENT_PARAMS = {
+    "http_options": HttpOptions(
+        client_args={"http2": True, "limits": _LIMITS},
+        async_client_args={"http2": True, "limits": _LIMITS},
+    )
+}
+
+# One pooled client per event loop: connections are bound to the loop that opened
+# them, and the workflows and the shared tools loop all make requests
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_LOCK = threading.Lock()
+_close_registered = False
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared keep-alive HTTP client of the running event loop.
+
+    Each loop gets its own client, created on first use and kept until the loop is
+    garbage collected or aclose_async_client is called from it.
+
+    Returns:
+        httpx.AsyncClient: The pooled client.
+    """
+    global _close_registered
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=_LIMITS,
+                headers={"User-Agent": USER_AGENT},
+                timeout=60,
+                verify=False,
+                follow_redirects=True,
+            )
+            _CLIENTS[loop] = client
+        if not _close_registered:
+            # Closes the clients of the loops still running at exit, e.g. the tools loop
+            atexit.register(_close_clients)
+            _close_registered = True
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the client of the running event loop, if it has one. Call before the loop ends."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _close_clients() -> None:
+    """Close the clients of the loops still running at exit, such as the tools loop."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.items())
+        _CLIENTS.clear()
+    for loop, client in clients:
+        if loop.is_running() and not loop.is_closed():
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            try:
+                future.result(timeout=5)
+            except Exception:
+                pass
@@ -0,0 +1,94 @@
+import asyncio
+import atexit
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional
+
+# Background event loop shared by the toolkits. Browsers and pooled HTTP connections
+# are bound to the loop that created them, so all of them live on this one.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_THREAD: Optional[threading.Thread] = None
+_LOOP_LOCK = threading.Lock()
+
+# Tasks running on the background loop, keyed by what they compute. Only touched
+# from the loop's own thread, so no lock is needed.
+_INFLIGHT: Dict[Hashable, asyncio.Task] = {}
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _LOOP, _THREAD
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="tools-loop", daemon=True
+            )
+            thread.start()
+            _LOOP = loop
+            _THREAD = thread
+    return _LOOP
+
+
+def run(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result.
+
+    Args:
+        coro (Coroutine): The coroutine to run.
+        timeout (Optional[float]): Seconds to wait before cancelling the coroutine.
+
+    Returns:
+        Any: The result of the coroutine.
+    """
+    loop = get_loop()
+    if threading.current_thread() is _THREAD:
+        coro.close()
+        raise RuntimeError("Cannot block on the tools loop from its own thread.")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
+
+def is_inflight(key: Hashable) -> bool:
+    """Whether a task for key is running on the background loop. Call from the loop."""
+    return key in _INFLIGHT
+
+
+async def coalesce(key: Hashable, factory: Callable[[], Coroutine]) -> Any:
+    """
+    Await the task computing key, starting it only if none is already running.
+
+    Identical calls made at the same time, e.g. by agents working on several companies,
+    share a single task. Each caller is shielded, so a caller timing out does not cancel
+    the task for the others. Must run on the background loop.
+
+    Args:
+        key (Hashable): Identifies the result, e.g. the URL and the settings used.
+        factory (Callable[[], Coroutine]): Creates the coroutine computing the result.
+
+    Returns:
+        Any: The result of the task.
+    """
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = task
+
+        def forget(done: asyncio.Task) -> None:
+            if _INFLIGHT.get(key) is done:
+                del _INFLIGHT[key]
+
+        task.add_done_callback(forget)
+    return await asyncio.shield(task)
+
+
+@atexit.register
+def _shutdown() -> None:
+    # Registered first, so it runs after the toolkits' own atexit cleanups
+    if _LOOP is not None:
+        _LOOP.call_soon_threadsafe(_LOOP.stop)
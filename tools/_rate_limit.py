@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts of `max_rate` calls, refilled over `time_period` seconds."""
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only while the bucket is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens
+                    + (now - self._updated) * self.max_rate / self.time_period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+            time.sleep(wait)
+
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+class AdaptiveLimiter:
+    """Async concurrency limit that halves when the provider is overloaded and grows back by one after `grow_after` successes."""
+
+    def __init__(self, initial: int, max_limit: int = 64, grow_after: int = 10):
+        self.limit = max(1, min(initial, max_limit))
+        self.max_limit = max_limit
+        self.grow_after = grow_after
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until fewer than `limit` calls are in flight."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, overloaded: bool = False) -> None:
+        """End a call, shrinking the limit if it was rejected as overloaded."""
+        async with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.grow_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
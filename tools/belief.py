@@ -0,0 +1,80 @@
+from typing import Any, Dict, List, Optional, Set
+
+from agno.utils.log import log_debug
+
+
+class InsidersBelief:
+    """Tracks the insiders found so far, to stop the search loop once it stops finding new ones."""
+
+    CATEGORIES = ("board", "auditors", "top_managers", "committees")
+
+    def __init__(
+        self,
+        min_iterations: int = 3,
+        min_insiders: int = 8,
+        patience: int = 2,
+    ):
+        self.min_iterations = min_iterations  # Iterations before the size check can stop the loop
+        self.min_insiders = min_insiders  # Insiders found after which the loop can stop
+        self.patience = patience  # Consecutive iterations without new insiders before stopping
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the belief state, call it before every new search."""
+        self.belief: Dict[str, Set[str]] = {c: set() for c in self.CATEGORIES}
+        self.iterations = 0
+        self.stale_iterations = 0
+
+    def record_iteration(
+        self,
+        board: Optional[List[str]] = None,
+        auditors: Optional[List[str]] = None,
+        top_managers: Optional[List[str]] = None,
+        committees: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record the insiders found in the current search iteration and check whether to keep searching.
+
+        Args:
+            board (list[str]): Names of the members of the board of directors found in this iteration.
+            auditors (list[str]): Names of the statutory or external auditors found in this iteration.
+            top_managers (list[str]): Names of the top managers (CEO, CFO, ...) found in this iteration.
+            committees (list[str]): Names of the members of internal committees found in this iteration.
+
+        Returns:
+            Dict[str, Any]: The insiders found so far by category and a "status",
+            "continue" or "stop".
+        """
+        found = {
+            "board": board,
+            "auditors": auditors,
+            "top_managers": top_managers,
+            "committees": committees,
+        }
+
+        new_insiders = 0
+        for category, names in found.items():
+            known = self.belief[category]
+            for name in names or []:
+                key = " ".join(name.casefold().split())
+                if key and key not in known:
+                    known.add(key)
+                    new_insiders += 1
+
+        self.iterations += 1
+        self.stale_iterations = 0 if new_insiders else self.stale_iterations + 1
+
+        total = len(set().union(*self.belief.values()))
+        exhausted = self.stale_iterations >= self.patience or (
+            self.iterations >= self.min_iterations and total >= self.min_insiders
+        )
+        log_debug(
+            f"Belief iteration {self.iterations}: {new_insiders} new, {total} total, exhausted={exhausted}"
+        )
+
+        return {
+            "iteration": self.iterations,
+            "new_insiders": new_insiders,
+            "known": {c: sorted(names) for c, names in self.belief.items()},
+            "status": "stop" if exhausted else "continue",
+        }
@@ -1,16 +1,23 @@
 import asyncio
+from collections import OrderedDict
+import logging
 import tempfile
 import os
-import threading
 import time
 import requests
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 from agno.tools import Toolkit
-from agno.utils.log import log_debug, log_warning
+from agno.utils.log import log_debug, log_warning, logger
 
 try:
-    from crawl4ai import AsyncWebCrawler, CacheMode, BrowserConfig, CrawlerRunConfig
+    from crawl4ai import (
+        AsyncWebCrawler,
+        CacheMode,
+        CrawlerRunConfig,
+        LXMLWebScrapingStrategy,
+    )
     from crawl4ai.content_filter_strategy import BM25ContentFilter, PruningContentFilter
     from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 except ImportError:
@@ -18,6 +25,44 @@ except ImportError:
         "`crawl4ai` not installed. Please install using `pip install crawl4ai`"
     )
 
+from tools import _crawler_pool, _loop
+from tools._http import get_async_client
+
+# Parses the crawled HTML with lxml instead of BeautifulSoup. Stateless, so one
+# instance serves every toolkit and keeps their coalescing keys equal.
+_SCRAPING_STRATEGY = LXMLWebScrapingStrategy()
+
+# Resources the browser cannot turn into markdown, recognised by extension or by content type
+_NON_HTML_EXTENSIONS = (
+    ".pdf",
+    ".zip",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".xls",
+    ".xlsx",
+    ".doc",
+    ".docx",
+    ".ppt",
+    ".pptx",
+)
+_NON_HTML_CONTENT_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/octet-stream",
+    "image/",
+    "application/msword",
+    "application/vnd.ms-",
+    "application/vnd.openxmlformats",
+)
+NON_HTML_MESSAGE = "Skipped: non-HTML content, it cannot be crawled. Use pdf_tools for PDF files."
+
+HEAD_CACHE_TTL = 10 * 60  # Seconds a content-type probe result is reused
+HEAD_TIMEOUT = 5.0  # Seconds allowed for a content-type probe
+HEAD_CACHE_SIZE = 1024  # Probe results kept, the least recently used are dropped first
+_HEAD_CACHE: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
 
 class CrawlTools(Toolkit):
     """Toolkit for crawling web pages and extracting content using Crawl4ai."""
@@ -28,7 +73,8 @@ class CrawlTools(Toolkit):
         timeout: int = 30,
         headless: bool = True,
         wait_until: str = "domcontentloaded",
-        cache_mode: bool = False,
+        cache_mode: Union[bool, CacheMode] = True,
+        base_directory: Optional[str] = None,
         check_robots_txt: bool = False,
         verbose: bool = False,
         remove_forms: bool = True,
@@ -47,6 +93,7 @@ class CrawlTools(Toolkit):
         # magic: bool = True,
         remove_overlay_elements: bool = True,
         governance_mode: bool = False,
+        probe_content_type: bool = False,
         **kwargs,
     ):
         super().__init__(name="crawl_tools", tools=[self.crawl], **kwargs)
@@ -54,23 +101,29 @@ class CrawlTools(Toolkit):
         self.timeout = timeout
         self.headless = headless
         self.wait_until = wait_until
-        self.cache_mode = CacheMode.BYPASS if not cache_mode else CacheMode.DEFAULT
+        # True reads and writes the Crawl4AI disk cache, False bypasses it; a CacheMode
+        # (e.g. CacheMode.READ_ONLY for CI) is used as is. Only repeated URLs get faster.
+        if isinstance(cache_mode, CacheMode):
+            self.cache_mode = cache_mode
+        else:
+            self.cache_mode = CacheMode.ENABLED if cache_mode else CacheMode.BYPASS
+        self.base_directory = base_directory  # Crawl4AI home (disk cache location)
         self.check_robots_txt = check_robots_txt
         self.verbose = verbose
         self.remove_forms = remove_forms
         self.exclude_external_links = exclude_external_links
         self.exclude_social_media_links = exclude_social_media_links
-        self.excluded_tags = excluded_tags or []
+        self.excluded_tags = list(excluded_tags) if excluded_tags else []
         self.use_pruning = use_pruning
         self.pruning_threshold = pruning_threshold
         self.bm25_threshold = bm25_threshold
         # self.magic = magic,
         self.remove_overlay_elements = remove_overlay_elements
         self.governance_mode = governance_mode
-
-    def _build_config(self, search_query: Optional[str] = None) -> Dict[str, Any]:
-        """Build CrawlerRunConfig parameters from toolkit settings."""
-        config_params = {
+        # Send a HEAD request before crawling URLs whose extension does not tell the type
+        self.probe_content_type = probe_content_type
+        # Settings are fixed per instance, so the base run config is built once
+        self._base_config_params: Dict[str, Any] = {
             "page_timeout": self.timeout * 1000,  # Convert to milliseconds
             "wait_until": self.wait_until,
             "cache_mode": self.cache_mode,
@@ -79,160 +132,252 @@ class CrawlTools(Toolkit):
             "exclude_external_links": self.exclude_external_links,
             "exclude_social_media_links": self.exclude_social_media_links,
             "excluded_tags": self.excluded_tags,
+            "scraping_strategy": _SCRAPING_STRATEGY,
             # "magic": self.magic,
         }
+        # Crawls of the same URL with the same settings share one in-flight task
+        self._coalesce_key = (
+            repr(self._base_config_params),
+            self.max_length,
+            self.use_pruning,
+            self.pruning_threshold,
+            self.bm25_threshold,
+            self.probe_content_type,
+        )
+        self._pruning_generator: Optional[DefaultMarkdownGenerator] = None
+        self._crawler: Optional[AsyncWebCrawler] = None  # Pooled crawler, set on first crawl
 
-        # Ensure excluded_tags is a list, not a tuple or nested structure
-        if self.excluded_tags and not isinstance(self.excluded_tags, list):
-            config_params["excluded_tags"] = list(self.excluded_tags)
-
-        if self.use_pruning or search_query:
-            if search_query:
-                content_filter = BM25ContentFilter(
-                    user_query=search_query, bm25_threshold=self.bm25_threshold
-                )
-                log_debug(f"Using BM25ContentFilter for query: {search_query}")
-            else:
-                content_filter = PruningContentFilter(
-                    threshold=self.pruning_threshold,
-                    threshold_type="fixed",
-                    min_word_threshold=2,
-                )
-                log_debug("Using PruningContentFilter for general cleanup")
+    def _build_config(self, search_query: Optional[str] = None) -> Dict[str, Any]:
+        """Build CrawlerRunConfig parameters from toolkit settings."""
+        config_params = self._base_config_params.copy()
 
+        if search_query:
+            content_filter = BM25ContentFilter(
+                user_query=search_query, bm25_threshold=self.bm25_threshold
+            )
+            log_debug(f"Using BM25ContentFilter for query: {search_query}")
             config_params["markdown_generator"] = DefaultMarkdownGenerator(
                 content_filter=content_filter
             )
             log_debug("Using DefaultMarkdownGenerator with content_filter")
+        elif self.use_pruning:
+            if self._pruning_generator is None:
+                self._pruning_generator = DefaultMarkdownGenerator(
+                    content_filter=PruningContentFilter(
+                        threshold=self.pruning_threshold,
+                        threshold_type="fixed",
+                        min_word_threshold=2,
+                    )
+                )
+            log_debug("Using PruningContentFilter for general cleanup")
+            config_params["markdown_generator"] = self._pruning_generator
 
         return config_params
 
-    def _run_coro_in_thread(self, coro: asyncio.coroutines) -> Any:
-        """Run coroutine in a separate thread with its own event loop and return the result."""
-        result_container: Dict[str, Any] = {}
-        exc_container: Dict[str, BaseException] = {}
-
-        def _runner():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                result_container["result"] = loop.run_until_complete(coro)
-            except BaseException as e:
-                exc_container["exc"] = e
-            finally:
-                try:
-                    loop.close()
-                except Exception:
-                    pass
-
-        t = threading.Thread(target=_runner, daemon=True)
-        t.start()
-        t.join()
-
-        if "exc" in exc_container:
-            raise exc_container["exc"]
-        return result_container.get("result")
-
     def crawl(
         self,
         url: Union[str, List[str]],  # search_query: Optional[str] = None
-    ) -> Union[str, Dict[str, str]]:
+    ) -> str:
         """
         Crawl URLs and extract their text content in markdown format.
 
         Args:
-            url (str): single url to crawl.
+            url (str | list[str]): single url, or list of urls, to crawl.
 
         Returns:
-            The extracted text content from the URL in markdown format.
+            The extracted text content from the URL in markdown format. For a list, one
+            "## <url>" section per page.
         """
         if not url:
             return "Error: No URL provided"
 
-        def _call_async(url_to_call: str, search_query: Optional[str] = None):
-            # If there's already a running loop, run the coroutine in a new thread.
-            try:
-                asyncio.get_running_loop()
-                # running loop -> run in background thread with its own loop
-                return self._run_coro_in_thread(self._async_crawl(url_to_call, search_query))
-            except RuntimeError:
-                # no running loop -> safe to use asyncio.run
-                return asyncio.run(self._async_crawl(url_to_call, search_query))
-
         # Handle single URL
         if isinstance(url, str):
+            if _has_non_html_extension(url):
+                return NON_HTML_MESSAGE
             try:
-                return _call_async(url)
+                return self._submit(self._async_crawl(url))
             except Exception as e:
                 return f"Error during crawl: {e}"
 
-        # Handle list of URLs
+        # Handle list of URLs in one batch on a single browser
         results: Dict[str, str] = {}
-        for single_url in url:
+        to_crawl: List[str] = []
+        for single_url in dict.fromkeys(url):
+            if _has_non_html_extension(single_url):
+                results[single_url] = NON_HTML_MESSAGE
+            else:
+                to_crawl.append(single_url)
+
+        if to_crawl:
             try:
-                results[single_url] = _call_async(single_url)
+                crawled = self._submit(
+                    self._async_crawl_many(to_crawl), n_urls=len(to_crawl)
+                )
             except Exception as e:
-                results[single_url] = f"Error during crawl: {e}"
-        return results
+                crawled = {u: f"Error during crawl: {e}" for u in to_crawl}
+            results.update(crawled)
+
+        # One markdown document with a section per page, in the requested order
+        return "\n\n".join(
+            f"## {single_url}\n\n{results[single_url]}"
+            for single_url in dict.fromkeys(url)
+        )
+
+    def _submit(self, coro: Coroutine, n_urls: int = 1) -> Any:
+        """Run a coroutine on the shared background loop, which owns the pooled browsers."""
+        # Page timeout per URL plus headroom for browser start-up
+        return _loop.run(coro, timeout=self.timeout * n_urls + 30)
+
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Return this toolkit's crawler, taking it from the pool on first use."""
+        if self._crawler is None:
+            self._crawler = await _crawler_pool.get_crawler(
+                self.headless, self.verbose, self.base_directory
+            )
+        return self._crawler
+
+    def close(self) -> None:
+        """Release this toolkit's crawler handle (the browser stays in the pool until exit)."""
+        self._crawler = None
+
+    def _extract_content(self, result: Any) -> str:
+        """Extract the markdown content from a crawl result, truncated to max_length."""
+
+        # Process the result
+        if not result:
+            return "Error: No content found"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            log_debug(
+                f"Result success: {getattr(result, 'success', 'N/A')}, "
+                f"markdown: {bool(getattr(result, 'markdown', None))}"
+            )
+
+        # Prefer the result's fit_markdown, then raw markdown, then any text content
+        markdown = getattr(result, "markdown", None)
+        content = (
+            getattr(result, "fit_markdown", None)
+            or getattr(markdown, "raw_markdown", None)
+            or (str(markdown) if markdown else None)
+            or getattr(result, "text", None)
+            or ""
+        )
+
+        if not content:
+            if getattr(result, "html", None):
+                log_warning("Only HTML available, no markdown extracted")
+                return "Error: Could not extract markdown from page"
+            log_warning(f"No content extracted. Result type: {type(result)}")
+            return "Error: No readable content extracted"
+
+        log_debug(f"Extracted content length: {len(content)}")
+
+        # Truncate if needed
+        if self.max_length and len(content) > self.max_length:
+            content = content[: self.max_length] + "..."
+
+        return content
 
     async def _async_crawl(self, url: str, search_query: Optional[str] = None) -> str:
+        """Crawl a single URL and extract content, joining an identical crawl in progress."""
+        return await _loop.coalesce(
+            ("crawl", url, search_query, self._coalesce_key),
+            lambda: self._crawl_page(url, search_query),
+        )
+
+    async def _crawl_page(self, url: str, search_query: Optional[str] = None) -> str:
         """Crawl a single URL and extract content."""
 
-        try:
-            browser_config = BrowserConfig(
-                headless=self.headless,
-                verbose=self.verbose,
-            )
+        if self.probe_content_type and await _probe_non_html(url):
+            return NON_HTML_MESSAGE
 
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                # Build configuration from parameters
-                config_params = self._build_config(search_query)
+        try:
+            crawler = await self._get_crawler()
+            # Build configuration from parameters
+            config_params = self._build_config(search_query)
 
-                config = CrawlerRunConfig(**config_params)
+            config = CrawlerRunConfig(**config_params)
+            if logger.isEnabledFor(logging.DEBUG):
                 log_debug(f"Crawling URL: {url} with config: {config}")
-                result = await crawler.arun(url=url, config=config)
-
-                # Process the result
-                if not result:
-                    return "Error: No content found"
-
-                log_debug(f"Result attributes: {dir(result)}")
-                log_debug(f"Result success: {getattr(result, 'success', 'N/A')}")
-
-                # Try to get markdown content
-                content = ""
-                if hasattr(result, "fit_markdown") and result.fit_markdown:
-                    content = result.fit_markdown
-                    log_debug("Using fit_markdown")
-                elif hasattr(result, "markdown") and result.markdown:
-                    if hasattr(result.markdown, "raw_markdown"):
-                        content = result.markdown.raw_markdown
-                        log_debug("Using markdown.raw_markdown")
-                    else:
-                        content = str(result.markdown)
-                        log_debug("Using str(markdown)")
-                else:
-                    # Try to get any text content
-                    if hasattr(result, "text"):
-                        content = result.text
-                        log_debug("Using text attribute")
-                    elif hasattr(result, "html"):
-                        log_warning("Only HTML available, no markdown extracted")
-                        return "Error: Could not extract markdown from page"
-
-                if not content:
-                    log_warning(f"No content extracted. Result type: {type(result)}")
-                    return "Error: No readable content extracted"
-
-                log_debug(f"Extracted content length: {len(content)}")
-
-                # Truncate if needed
-                if self.max_length and len(content) > self.max_length:
-                    content = content[: self.max_length] + "..."
-
-                return content
+            result = await crawler.arun(url=url, config=config)
+
+            return self._extract_content(result)
+
+        except Exception as e:
+            log_warning(f"Exception during crawl: {str(e)}")
+            return _crawl_error_message(e)
+
+    async def _async_crawl_many(
+        self, urls: List[str], search_query: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Crawl several URLs concurrently on one browser and extract their content."""
+
+        # URLs already being crawled with the same settings are awaited, not crawled again
+        inflight = [
+            url
+            for url in urls
+            if _loop.is_inflight(("crawl", url, search_query, self._coalesce_key))
+        ]
+        if inflight:
+            urls = [url for url in urls if url not in inflight]
+            shared, crawled = await asyncio.gather(
+                asyncio.gather(*(self._async_crawl(url, search_query) for url in inflight)),
+                self._async_crawl_many(urls, search_query)
+                if urls
+                else asyncio.sleep(0, result={}),
+            )
+            return {**dict(zip(inflight, shared)), **crawled}
 
+        skipped: Dict[str, str] = {}
+        if self.probe_content_type:
+            non_html = await asyncio.gather(*(_probe_non_html(url) for url in urls))
+            skipped = {url: NON_HTML_MESSAGE for url, skip in zip(urls, non_html) if skip}
+            urls = [url for url in urls if url not in skipped]
+            if not urls:
+                return skipped
+
+        try:
+            crawler = await self._get_crawler()
+            config = CrawlerRunConfig(**self._build_config(search_query))
+            if logger.isEnabledFor(logging.DEBUG):
+                log_debug(f"Crawling {len(urls)} URLs with config: {config}")
+            crawl_results = await crawler.arun_many(urls=urls, config=config)
         except Exception as e:
             log_warning(f"Exception during crawl: {str(e)}")
-            error_msg = f"Crawl4AI Error: This page is not fully supported. Error Message: {str(e)} Possible reasons: 1. The page may have restrictions that prevent crawling. 2. The page might not be fully loaded. Suggestions: - Try calling the crawl function with these parameters: magic=True, - Set headless=False to visualize what's happening on the page. If the issue persists, please check the page's structure and any potential anti-crawling measures."
-            return error_msg
+            return {**skipped, **{url: _crawl_error_message(e) for url in urls}}
+
+        by_url = {getattr(result, "url", None): result for result in crawl_results}
+        return {**skipped, **{url: self._extract_content(by_url.get(url)) for url in urls}}
+
+
+def _has_non_html_extension(url: str) -> bool:
+    return urlparse(url).path.lower().endswith(_NON_HTML_EXTENSIONS)
+
+
+async def _probe_non_html(url: str) -> bool:
+    """Whether a HEAD request reports a non-HTML content type, cached for HEAD_CACHE_TTL."""
+    now = time.monotonic()
+    cached = _HEAD_CACHE.get(url)
+    if cached is not None and now - cached[0] < HEAD_CACHE_TTL:
+        _HEAD_CACHE.move_to_end(url)
+        return cached[1]
+
+    try:
+        response = await get_async_client().head(url, timeout=HEAD_TIMEOUT)
+        ctype = (response.headers.get("content-type") or "").lower()
+        non_html = ctype.startswith(_NON_HTML_CONTENT_TYPES)
+    except Exception as e:
+        # Let the browser try: many servers reject or mishandle HEAD requests
+        log_debug(f"HEAD probe failed for {url}: {e}")
+        non_html = False
+
+    _HEAD_CACHE[url] = (now, non_html)
+    _HEAD_CACHE.move_to_end(url)
+    if len(_HEAD_CACHE) > HEAD_CACHE_SIZE:
+        _HEAD_CACHE.popitem(last=False)
+    return non_html
+
+
+def _crawl_error_message(e: Exception) -> str:
+    return f"Crawl4AI Error: This page is not fully supported. Error Message: {str(e)} Possible reasons: 1. The page may have restrictions that prevent crawling. 2. The page might not be fully loaded. Suggestions: - Try calling the crawl function with these parameters: magic=True, - Set headless=False to visualize what's happening on the page. If the issue persists, please check the page's structure and any potential anti-crawling measures."
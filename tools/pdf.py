@@ -1,8 +1,12 @@
 import asyncio
+import atexit
+from itertools import chain
 import os
 import tempfile
 import threading
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 import requests
 from io import BytesIO
@@ -12,7 +16,11 @@ from agno.utils.log import logger
 from agno.utils.log import log_debug, log_warning
 import urllib3
 
-from playwright.async_api import async_playwright
+import httpx
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from tools import _loop
+from tools._http import USER_AGENT, get_async_client
 
 try:
     import PyPDF2
@@ -21,77 +29,219 @@ except ImportError:
         "`PyPDF2` not installed. Please install it with `pip install PyPDF2`."
     )
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    raise ImportError(
+        "`pypdfium2` not installed. Please install it with `pip install pypdfium2`."
+    )
+
+
+# Markers of WAF/challenge pages served instead of the requested document
+_CHALLENGE_MARKERS = (b"_Incapsula_Resource", b"visid_incap", b"captcha")
+
+# Bytes requested first when only max_length characters of text are needed
+RANGE_PROBE_BYTES = 1024 * 1024
+
+# Pages per task when extracting large PDFs in the process pool
+PAGE_BATCH_SIZE = 8
+
+# PDFium is not thread-safe: every call made from a thread of this process holds this
+# lock. Worker processes of the pool have their own PDFium and do not take it.
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _extract_page_range(path: str, start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) of a PDF file. Runs in a worker process."""
+    pdf = pdfium.PdfDocument(path)
+    try:
+        texts = []
+        for index in range(start, end):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range() + "\n")
+            textpage.close()
+            page.close()
+        return texts
+    finally:
+        pdf.close()
+
+
+def _count_pages(data: bytes) -> int:
+    """Number of pages of a PDF, read by PDFium."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+def _write_temp_file(data: bytes) -> str:
+    """Write data to a named temporary file and return its path. The caller removes it."""
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(data)
+    return f.name
+
+
+def _is_partial(response: httpx.Response) -> bool:
+    """Whether a 206 response holds only the start of the file."""
+    # Content-Range: bytes 0-1048575/<total>
+    total = (response.headers.get("content-range") or "").rpartition("/")[2]
+    return not (total.isdigit() and int(total) <= len(response.content))
+
+
+def _can_open_pdf(data: bytes) -> bool:
+    """Whether PDFium can open the start of a PDF. Only linearized PDFs can."""
+    if not data.startswith(b"%PDF"):
+        return False
+    try:
+        with _PDFIUM_LOCK:
+            pdfium.PdfDocument(data).close()
+    except pdfium.PdfiumError:
+        return False
+    return True
+
+
+def _join_truncated(parts: List[str], max_length: Optional[int]) -> str:
+    """Join parts, cut to max_length characters plus "...", in a single allocation."""
+    if not max_length:
+        return "".join(parts)
+
+    kept = []
+    remaining = max_length
+    for part in parts:
+        if len(part) > remaining:
+            kept.append(part[:remaining])
+            kept.append("...")
+            break
+        kept.append(part)
+        remaining -= len(part)
+    return "".join(kept)
+
 
 class PDFTools(Toolkit):
     """Toolkit for handling PDF files."""
 
-    def __init__(self, max_length: int = 10000, **kwargs):
+    _executor: Optional[ProcessPoolExecutor] = None  # Shared across instances, created lazily
+
+    def __init__(
+        self,
+        max_length: int = 10000,
+        parallel_min_pages: int = 64,
+        timeout: int = 180,
+        **kwargs,
+    ):
         self.max_length = max_length
+        self.timeout = timeout  # Seconds allowed for a whole download + extraction
+        self.parallel_min_pages = parallel_min_pages  # Page count from which extraction runs in a process pool
+        # Chromium is launched on the first download that needs it and reused afterwards
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        # Concurrent downloads wait for a single launch instead of starting their own
+        self._browser_lock = asyncio.Lock()
+        self._close_registered = False
         super().__init__(name="pdf_tools", tools=[self.get_pdf_content], **kwargs)
 
     def get_pdf_content(self, pdf_path: str) -> str:
         try:
-            asyncio.get_running_loop()
-            # running loop -> run in background thread with its own loop
-            return self._run_coro_in_thread(self._download_report(pdf_path))
-        except RuntimeError:
-            # no running loop -> safe to use asyncio.run
-            return asyncio.run(self._download_report(pdf_path))
-        
-    def _run_coro_in_thread(self, coro: asyncio.coroutines) -> Any:
-        """Run coroutine in a separate thread with its own event loop and return the result."""
-        result_container: Dict[str, Any] = {}
-        exc_container: Dict[str, BaseException] = {}
-
-        def _runner():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                result_container["result"] = loop.run_until_complete(coro)
-            except BaseException as e:
-                exc_container["exc"] = e
-            finally:
+            # Agents reading the same report at the same time share one download
+            return _loop.run(
+                _loop.coalesce(
+                    ("pdf", pdf_path, self.max_length),
+                    lambda: self._download_report(pdf_path),
+                ),
+                timeout=self.timeout,
+            )
+        except FutureTimeoutError:
+            log_warning(f"Timed out downloading {pdf_path}")
+            return "Unable to download report."
+
+    async def _ensure_browser(self) -> BrowserContext:
+        """Return the toolkit's browser context, launching Chromium on first use."""
+        if self._context is not None:
+            return self._context
+
+        async with self._browser_lock:
+            # Another download may have launched it while this one waited
+            if self._context is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=["--ignore-ssl-errors", "--ignore-certificate-errors"],
+                )
+                self._context = await self._browser.new_context(
+                    user_agent=USER_AGENT,
+                    ignore_https_errors=True,
+                )
+                if not self._close_registered:
+                    atexit.register(self.close)
+                    self._close_registered = True
+        return self._context
+
+    async def _aclose(self) -> None:
+        for resource in (self._context, self._browser):
+            if resource is not None:
                 try:
-                    loop.close()
+                    await resource.close()
                 except Exception:
                     pass
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+        self._context = self._browser = self._playwright = None
 
-        t = threading.Thread(target=_runner, daemon=True)
-        t.start()
-        t.join()
-
-        if "exc" in exc_container:
-            raise exc_container["exc"]
-        return result_container.get("result")
+    def close(self) -> None:
+        """Close the toolkit's browser, if it was launched."""
+        if self._context is not None:
+            _loop.run(self._aclose())
 
     async def _download_report(self, report_url: str) -> str:
         """
-        Download the report using Playwright Async API and save to a temporary file.
-        Returns the temp file path.
+        Download the report using Playwright Async API and extract its text in memory.
+        Returns the extracted text or an error message.
         """
-        tmp_file_path = None
+        data = None
         origin = f"{urlparse(report_url).scheme}://{urlparse(report_url).netloc}"
 
+        # Plain HTTP first, Chromium is only needed when a WAF/JS challenge blocks it
+        data, not_pdf, partial = await self._fetch_pdf_direct(report_url)
+        if not_pdf:
+            return "URL does not point to a PDF file."
+        if data is not None:
+            text = None
+            try:
+                text = await self._aextract_text(data)
+            except Exception as e:
+                if not partial:
+                    return "Error processing PDF."
+            # A prefix can break on a later page or hold fewer pages than max_length needs
+            if partial and (text is None or len(text) < self.max_length):
+                logger.debug(f"Partial PDF was not enough, fetching all of {report_url}")
+                data, _, _ = await self._fetch_pdf_direct(report_url, probe=False)
+                if data is not None:
+                    try:
+                        return await self._aextract_text(data)
+                    except Exception as e:
+                        return "Error processing PDF."
+            if text is not None:
+                return text
+
         # suppress insecure request warnings for fallback fetch
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--ignore-ssl-errors", "--ignore-certificate-errors"],
-                )
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    ignore_https_errors=True,
-                )
-                page = await context.new_page()
-
+            context = await self._ensure_browser()
+            page = await context.new_page()
+            try:
                 # Try a navigation to detect WAF/challenge (don't rely on it for PDF body)
                 resp = None
                 try:
                     resp = await page.goto(
-                        report_url, wait_until="networkidle", timeout=30000
+                        report_url, wait_until="domcontentloaded", timeout=15000
                     )
                 except Exception as e:
                     # navigation for PDF often raises ERR_ABORTED; swallow and continue to detection/fetch
@@ -128,16 +278,23 @@ class PDFTools(Toolkit):
                         f"WAF/challenge detected for {report_url}, doing origin pre-flight {origin}"
                     )
                     try:
-                        await page.goto(origin, wait_until="networkidle", timeout=45000)
+                        await page.goto(
+                            origin, wait_until="domcontentloaded", timeout=15000
+                        )
                         for pth in ["/", "/en", "/it"]:
                             try:
                                 await page.goto(
                                     origin.rstrip("/") + pth,
-                                    wait_until="networkidle",
-                                    timeout=20000,
+                                    wait_until="domcontentloaded",
+                                    timeout=15000,
                                 )
                             except Exception:
                                 pass
+                        # Give the challenge script a moment to set its cookies
+                        try:
+                            await page.wait_for_load_state("load", timeout=5000)
+                        except Exception:
+                            pass
                     except Exception as e:
                         logger.warning(f"Pre-flight origin visit failed: {e}")
 
@@ -152,35 +309,29 @@ class PDFTools(Toolkit):
                     logger.warning(f"context.request.get failed: {e}")
                     response = None
 
-                data = None
-                suffix = ""
                 if response is not None and 200 <= response.status < 300:
                     ctype = (response.headers.get("content-type") or "").lower()
                     if "application/pdf" in ctype or report_url.lower().endswith(
                         ".pdf"
                     ):
                         data = await response.body()
-                        suffix = ".pdf"
                     elif "text/html" in ctype or report_url.lower().endswith(".html"):
                         return "URL does not point to a PDF file."
 
                 else:
                     # If Playwright failed and the failure looks like a cert issue or context.request failed,
-                    # try a simple requests.get fallback (disable SSL verification).
+                    # try a plain HTTP fallback on the pooled client (SSL verification disabled).
                     tried_requests_fallback = False
                     if response is None:
-                        err_msg = ""
-                        # If we have debug log of earlier exception, check for certificate text in it
                         # fall back unconditionally when context.request.get didn't succeed
                         try:
                             logger.info(
-                                "Attempting requests fallback with verify=False due to Playwright request failure."
+                                "Attempting HTTP fallback with verify=False due to Playwright request failure."
                             )
-                            headers = {
-                                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                            }
-                            r = requests.get(
-                                report_url, headers=headers, timeout=60, verify=False
+                            r = await get_async_client().get(
+                                report_url,
+                                headers={"User-Agent": USER_AGENT},
+                                timeout=60.0,
                             )
                             tried_requests_fallback = True
                             if 200 <= r.status_code < 300:
@@ -190,7 +341,6 @@ class PDFTools(Toolkit):
                                     or report_url.lower().endswith(".pdf")
                                 ):
                                     data = r.content
-                                    suffix = ".pdf"
                                 elif (
                                     "text/html" in ctype
                                     or report_url.lower().endswith(".html")
@@ -198,17 +348,17 @@ class PDFTools(Toolkit):
                                     return "URL does not point to a PDF file."
                             else:
                                 logger.debug(
-                                    f"requests fallback returned status {r.status_code}"
+                                    f"HTTP fallback returned status {r.status_code}"
                                 )
                         except Exception as e:
-                            logger.debug(f"requests fallback failed: {e}")
+                            logger.debug(f"HTTP fallback failed: {e}")
                             tried_requests_fallback = False
 
                     if (data is None) and (not tried_requests_fallback):
                         # Last-resort fallback: try a lighter navigation and grab page content
                         try:
                             resp2 = await page.goto(
-                                report_url, wait_until="domcontentloaded", timeout=30000
+                                report_url, wait_until="domcontentloaded", timeout=15000
                             )
                             # try to detect pdf by headers if present
                             ctype = ""
@@ -218,56 +368,205 @@ class PDFTools(Toolkit):
                                 ).lower()
                             if resp2 is not None and "application/pdf" in ctype:
                                 data = await resp2.body()
-                                suffix = ".pdf"
                             else:
                                 return "URL does not point to a PDF file."
                         except Exception as e:
                             return "Unable to fetch report after retries."
-
-                # write to temp file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=suffix
-                ) as tmp_file:
-                    tmp_file.write(data or b"")
-                    tmp_file_path = tmp_file.name
-
-                try:
-                    await context.close()
-                except Exception:
-                    pass
+            finally:
                 try:
-                    await browser.close()
+                    await page.close()
                 except Exception:
                     pass
         except Exception as e:
             return "Unable to download report."
 
-        if not tmp_file_path:
+        if data is None:
             return "Unable to download report."
-        
+
         try:
-            if tmp_file_path.endswith(".pdf"):
-                pdf_file = BytesIO(response.content)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
+            return await self._aextract_text(data)
+        except Exception as e:
+            return "Error processing PDF."
 
-                text = "### PDF Content ###\n"
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+    async def _fetch_pdf_direct(
+        self, report_url: str, probe: bool = True
+    ) -> Tuple[Optional[bytes], bool, bool]:
+        """
+        Fetch the report with the pooled HTTP client, without a browser.
 
-                if self.max_length and len(text) > self.max_length:
-                    text = text[: self.max_length] + "..."
+        Args:
+            report_url (str): The URL of the report.
+            probe (bool): Whether to request only the first RANGE_PROBE_BYTES of a
+                larger file when max_length is set.
 
-                return text
-        except Exception as e:
-            return "Error processing PDF."
+        Returns:
+            Tuple[Optional[bytes], bool, bool]: The PDF bytes (None if the browser
+                fallback is needed), whether the URL points to a regular HTML page
+                instead of a PDF, and whether the bytes are only the start of the file.
+        """
+        client = get_async_client()
+        headers = None
+        # With a text budget, the first part of a large file is usually enough
+        if probe and self.max_length:
+            size = await self._get_content_length(report_url)
+            if size is None or size > RANGE_PROBE_BYTES:
+                headers = {"Range": f"bytes=0-{RANGE_PROBE_BYTES - 1}"}
+        try:
+            response = await client.get(report_url, headers=headers)
+            partial = response.status_code == 206 and _is_partial(response)
+            if partial and not await asyncio.to_thread(_can_open_pdf, response.content):
+                logger.debug(f"Partial PDF not readable, fetching all of {report_url}")
+                response = await client.get(report_url)
+                partial = False
+        except httpx.HTTPError as e:
+            logger.debug(f"Direct fetch failed for {report_url}: {e}")
+            return None, False, False
+
+        if not 200 <= response.status_code < 300:
+            logger.debug(f"Direct fetch returned status {response.status_code}")
+            return None, False, False
+
+        body = response.content
+        if body.startswith(b"%PDF"):
+            return body, False, partial
+
+        ctype = (response.headers.get("content-type") or "").lower()
+        if "text/html" in ctype and not any(
+            marker in body for marker in _CHALLENGE_MARKERS
+        ):
+            return None, True, False
+
+        return None, False, False
+
+    async def _get_content_length(self, report_url: str) -> Optional[int]:
+        """The Content-Length a HEAD request reports for the URL, or None if unknown."""
+        try:
+            response = await get_async_client().head(report_url, timeout=10.0)
+        except httpx.HTTPError as e:
+            logger.debug(f"HEAD request failed for {report_url}: {e}")
+            return None
+        length = response.headers.get("content-length", "")
+        if response.is_success and length.isdigit():
+            return int(length)
+        return None
+
+    async def _aextract_text(self, data: bytes) -> str:
+        """
+        Extract the text of a PDF, in the process pool when all of a large PDF is needed.
+
+        With a max_length the first pages are enough, so they are read one after
+        another until the budget is reached.
+
+        Args:
+            data (bytes): The PDF file contents.
+
+        Returns:
+            str: The extracted text, truncated to max_length.
+        """
+        if not self.max_length:
+            try:
+                n_pages = await asyncio.to_thread(_count_pages, data)
+            except pdfium.PdfiumError:
+                n_pages = 0  # Left to the PyPDF2 fallback
+            if n_pages >= self.parallel_min_pages:
+                pages = await self._extract_pages_parallel(data, n_pages)
+                return "".join(["### PDF Content ###\n", *pages])
+
+        # PDFium and PyPDF2 block, keep them off the loop shared by every tool
+        return await asyncio.to_thread(self._extract_text, data)
+
+    def _extract_text(self, data: bytes) -> str:
+        """
+        Extract the text of a PDF with PDFium, falling back to PyPDF2.
+
+        Pages are only extracted until max_length characters are collected.
+
+        Args:
+            data (bytes): The PDF file contents.
+
+        Returns:
+            str: The extracted text, truncated to max_length.
+        """
+        parts = ["### PDF Content ###\n"]
+        try:
+            self._extract_pages_pdfium(data, parts)
+        except pdfium.PdfiumError as e:
+            log_warning(f"PDFium could not read the PDF, falling back to PyPDF2: {e}")
+            parts = parts[:1]
+            self._extract_pages_pypdf2(data, parts)
+
+        return _join_truncated(parts, self.max_length)
+
+    def _extract_pages_pdfium(self, data: bytes, parts: List[str]) -> None:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                length = len(parts[0])
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    parts.append(textpage.get_text_range() + "\n")
+                    textpage.close()
+                    page.close()
+
+                    length += len(parts[-1])
+                    if self.max_length and length > self.max_length:
+                        break
+            finally:
+                pdf.close()
+
+    async def _extract_pages_parallel(self, data: bytes, n_pages: int) -> List[str]:
+        """
+        Extract all the pages in batches, in worker processes (PDFium is not thread-safe).
+
+        The workers open the PDF from a temporary file, so its bytes are written once
+        instead of being pickled for every batch.
+
+        Args:
+            data (bytes): The PDF file contents.
+            n_pages (int): The number of pages of the PDF.
+
+        Returns:
+            List[str]: The text of each page, in order.
+        """
+        path = await asyncio.to_thread(_write_temp_file, data)
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            batches = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _extract_page_range,
+                        path,
+                        start,
+                        min(start + PAGE_BATCH_SIZE, n_pages),
+                    )
+                    for start in range(0, n_pages, PAGE_BATCH_SIZE)
+                )
+            )
         finally:
             try:
-                if tmp_file_path and os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
-            except Exception:
+                os.unlink(path)
+            except OSError:
                 pass
-        
-        return "No content extracted."
+        return list(chain.from_iterable(batches))
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """Return the process pool shared by all PDFTools instances."""
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor()
+        return cls._executor
+
+    def _extract_pages_pypdf2(self, data: bytes, parts: List[str]) -> None:
+        length = len(parts[0])
+        pdf_reader = PyPDF2.PdfReader(BytesIO(data))
+        for page in pdf_reader.pages:
+            parts.append(page.extract_text() + "\n")
+
+            length += len(parts[-1])
+            if self.max_length and length > self.max_length:
+                break
 
 
 ################# Unused #######################
@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+import hashlib
 import os
-from textwrap import dedent
+import re
 import time
-from typing import Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 import json
 
 from agno.agent import Agent, RunResponse
@@ -14,11 +18,19 @@ from agno.tools.googlesearch import GoogleSearchTools
 from agno.tools.reasoning import ReasoningTools
 from agno.tools.sleep import SleepTools
 from agno.utils.pprint import pprint_run_response
-from agno.utils.log import log_debug, log_warning
+from agno.utils.log import log_debug, log_info, log_warning
 
+from tools._http import GEMINI_CLIENT_PARAMS
+from tools._rate_limit import TokenBucket
+from tools.belief import InsidersBelief
 from tools.crawl import CrawlTools
 from tools.pdf import PDFTools
 
+from prompts.insiders_workflow_prompt import (
+    GOVERNANCE_REPORT_SYSTEM_MESSAGE,
+    INSIDERS_WEB_SYSTEM_MESSAGE,
+)
+
 
 class Role(BaseModel):
     role_name: Optional[str] = Field(None, description="name of the role")
@@ -67,187 +79,125 @@ class SearchResults(BaseModel):
     results: List[SearchResult] = Field(None, description="list of search results")
 
 
+# Web search results are cached per company for a week
+CACHE_DIR = ".insiders_cache"
+CACHE_TTL = 7 * 24 * 3600
+
+# Legal suffixes and filler words ignored when comparing company names
+_COMPANY_NAME_NOISE = re.compile(
+    r"\b(s\.?p\.?a|n\.?v|s\.?r\.?l|plc|inc|corp(oration)?|ltd|llc|group|the)\b\.?"
+)
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def _normalize_company_name(company_name: str) -> str:
+    """Lowercase the name and drop punctuation and legal suffixes."""
+    name = _COMPANY_NAME_NOISE.sub(" ", company_name.casefold())
+    return " ".join(_PUNCTUATION.sub(" ", name).split())
+
+
+# Upper bound on the web agent's search iterations
+MAX_SEARCH_ITERATIONS = 10
+
+# Agent runs allowed per minute across both agents, to stay under the Gemini quota
+AGENT_RUNS_PER_MINUTE = 10
+
+
+def _get_insider_category(insider: Insider) -> str:
+    """Map an insider to one of the belief-state categories from its roles."""
+    roles = " ".join(
+        f"{r.role_name or ''} {r.member_of or ''}" for r in insider.roles or []
+    ).lower()
+    if "auditor" in roles or "sindac" in roles:
+        return "auditors"
+    if "committee" in roles or "comitato" in roles:
+        return "committees"
+    if any(t in roles for t in ("chief", "ceo", "cfo", "coo", "manager", "officer")):
+        return "top_managers"
+    return "board"
+
+
 class InsidersWorkflow(Workflow):
     """Workflow to search for insiders of a company"""
 
-    # An agent to scan corporate governance reports
-    governance_report_agent = Agent(
-        name="Governance Report Agent",
-        model=Gemini(id="gemini-2.5-flash", temperature=0.1, top_p=0.95),
-        tools=[
-            GoogleSearchTools(fixed_max_results=3, cache_results=True),
-            PDFTools(cache_results=True),
-            CrawlTools(max_length=50000, cache_results=True),
-            ReasoningTools(add_instructions=True),
-        ],
-        system_message=dedent(
-            """
-            You are an agent specialized in corporate governance.
-
-            <task>
-            Your specific task is to search the web, find the latest annual governance report of a company specified by the user and extract all the insiders (see **context** section below).
-            For each insider you have also to extract the following information:
-            - name
-            - role (be specific, see **context** section below)
-            - who the insider reports to based on his role (see **context** section below)
-            - date of birth (if available, in the format dd-MM-YYYY)
-            - country of birdth (if available)
-            - date of first appointment (if available, in the format dd-MM-YYYY)
-            - any other information you can find about the insider (few lines summary)
-            </task>
-
-            <context>
-                <corporate_governance_model>
-                We are interested in italian companies, usually these companies corporate governance model is structured as follows:
-                - board of directors (approves the financial statements, manages the company). Is composed by directors which can be executive or non-executive, independent or not. Usually there is a chairman, a lead independent director and a president of the board of directors.
-                - board of statutory auditors (supervises the board of directors, ensures compliance with laws and regulations). Usually there is a president of the board of statutory auditors and other members. The board of statutory auditors is composed by independent members.
-                - top managers (responsible for the day-to-day management of the company). Usually there is a Chief Executive Officer (CEO), other can be Chief Financial Officer (CFO), Chief Operating Officer (COO), etc.
-                - committees (support the board of directors in specific areas, e.g. audit committee, compensation committee, etc.). Usually there is a chairman and other members.
-                - auditors (legal advisors, external auditors).
-                </corporate_governance_model>
-
-                <insiders>
-                Insiders are individuals who have access to non-public information about a company because of their position within the company. They can be:
-                - directors: members of the board of directors.
-                - auditors: members of the board of statutory auditors.
-                - managers: senior management roles that oversee specific departments or functions. Can be part of the board of directors.
-                - members of internal committees: usually are members of the board of directors.
-                </insiders>
-
-                <reports_to_chain>
-                Usually:
-                - president and chairman of the board of directors reports to the shareholders' meeting.
-                - directors report to the board of directors.
-                - chairman of the board of statutory auditors reports to the shareholders' meeting.
-                - auditors report to the board of statutory auditors.
-                - CEO reports to the board of directors.
-                - other managers report to the CEO or the board of directors.
-                </reports_to_chain>
-            </context>
-
-            <instructions>
-            Follow these instructions carefully:
-            1. Search for the latest annual governance report of the company using **google_search_tools**. Start with a general query like "company_name corporate governance".
-            2. Scan the search results for the URL of the governance report in PDF format:
-               - If the report URL is in search results: use the **pdf_tools** to extract the content of the report.
-               - If the report URL is NOT in search results: use the **crawl_tools** to crawl the pages returned by the search query and search a reference to the report.
-            3. When you have the report content, extract all the insiders and their information.
-            </instructions>
-
-            <considerations>
-            - If the PDF is not in the search results, you have to crawl the web pages returned in the search results to find a reference to the report. These pages can be trickier to parse, and may contain references to all the annual reports of the company, so you have to be careful to extract the correct one (the latest).
-            - Avoid scanning PDFs from unofficial sources, or that are NOT linked from the official company website.
-            - If some information is not available in the report, just leave it empty. Be sure to search the information before leaving it empty.
-            - Use the **reasoning_tools** to plan your actions.
-            - Be sure to exctract the governance report, not the financial report or other types of reports.
-            - Be sure to extract the report of the company specified by the user.
-            - Do NOT compose search queries that are too long or complex, keep them simple and with few keywords. Example: "company_name documenti governance", "company_name governance", "company_name investors", etc.
-            - Refine your queries based on the results you get, if you don't find the report in the first attempt.
-            </considerations>
-            """
-        ),
-        debug_mode=True,
-        show_tool_calls=True,
-        tool_call_limit=10,
-        add_datetime_to_instructions=True,
-        exponential_backoff=True,
-        retries=3,
-        use_json_mode=True,
-        response_model=SearchResults,
-    )
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Tracks the insiders found by the web agent to stop the search when exhausted
+        self.insiders_belief = InsidersBelief()
+        # Only blocks when agent runs approach the rate limit
+        self.run_limiter = TokenBucket(AGENT_RUNS_PER_MINUTE, 60)
+
+    @cached_property
+    def governance_report_agent(self) -> Agent:
+        """An agent to scan corporate governance reports, built on first use."""
+        return Agent(
+            name="Governance Report Agent",
+            model=Gemini(
+                id="gemini-2.5-flash",
+                temperature=0.1,
+                top_p=0.95,
+                client_params=GEMINI_CLIENT_PARAMS,
+            ),
+            tools=[
+                GoogleSearchTools(fixed_max_results=3, cache_results=True),
+                PDFTools(cache_results=True),
+                CrawlTools(max_length=50000, cache_results=True),
+                ReasoningTools(add_instructions=True),
+            ],
+            system_message=GOVERNANCE_REPORT_SYSTEM_MESSAGE,
+            debug_mode=True,
+            show_tool_calls=True,
+            tool_call_limit=10,
+            add_datetime_to_instructions=True,
+            exponential_backoff=True,
+            retries=3,
+            use_json_mode=True,
+            response_model=SearchResults,
+        )
 
-    # An agent to search the insiders on the web
-    insiders_web_agent = Agent(
-        name="Insiders Crawl Agent",
-        model=Gemini(id="gemini-2.5-flash", temperature=0.1, top_p=0.95),
-        tools=[
-            GoogleSearchTools(
-                fixed_max_results=5, cache_results=True
-            ),  # Cache results during testing
-            CrawlTools(max_length=25000, cache_results=True, governance_mode=False),
-            ReasoningTools(add_instructions=True),
-        ],
-        system_message=dedent(
-            """
-            You are an advanced web search agent specialized in corporate governance.
-            
-            <task>
-            Your specific task is to search the web, find and extract all the insiders (see **context section beloe).
-            For each insider you have also to extract the following information:
-            - name
-            - role (be specific, see **context section below**)
-            - who the insider reports to based on his role (see **context section below**)
-            - date of birth (if available, in the format dd-MM-YYYY)
-            - city of birth (if available)
-            - date of first appointment (if available, in the format dd-MM-YYYY)
-            - any other information you can find about the insider (few lines summary)
-            </task>
-
-            <context>
-                <corporate_governance_model>
-                We are interested in italian companies, usually these companies corporate governance model is structured as follows:
-                - board of directors (approves the financial statements, manages the company). Is composed by directors which can be executive or non-executive, independent or not. Usually there is a chairman, a lead independent director and a president of the board of directors.
-                - board of statutory auditors (supervises the board of directors, ensures compliance with laws and regulations). Usually there is a president of the board of statutory auditors and other members. The board of statutory auditors is composed by independent members.
-                - top managers (responsible for the day-to-day management of the company). Usually there is a Chief Executive Officer (CEO), other can be Chief Financial Officer (CFO), Chief Operating Officer (COO), etc.
-                - committees (support the board of directors in specific areas, e.g. audit committee, compensation committee, etc.). Usually there is a chairman and other members.
-                - auditors (legal advisors, external auditors).
-                </corporate_governance_model>
-
-                <insiders>
-                Insiders are individuals who have access to non-public information about a company because of their position within the company. They can be:
-                - directors: members of the board of directors.
-                - auditors: members of the board of statutory auditors.
-                - managers: senior management roles that oversee specific departments or functions. Can be part of the board of directors.
-                - members of internal committees: usually are members of the board of directors.
-                </insiders>
-
-                <reports_to_chain>
-                Usually:
-                - president and chairman of the board of directors reports to the shareholders' meeting.
-                - directors report to the board of directors.
-                - chairman of the board of statutory auditors reports to the shareholders' meeting.
-                - auditors report to the board of statutory auditors.
-                - CEO reports to the board of directors.
-                - other managers report to the CEO or the board of directors.
-                </reports_to_chain>
-            </context>
-
-            <instructions>
-            Follow these instructions carefully:
-            1. Search: create a search query and pass it to **google_search** tool.
-            2. Crawl: for each result pass the page URL to the **crawl_tools** tool to get the page content (DO NOT crawl URLs that you have already crawled).
-            3. Extract: read the page content and extract ALL the information about the insiders (Note: the page content is unstructured). DO NOT follow any link on the page, just read the content and extract the information you need.
-            4. Loop: if you have not found enough information or you think you counld potentially find more information repeat from step 1
-            </instructions>
-
-            <considerations>
-            - Always crawl the official company website. It usually has the most complete and updated information about the insiders. It usually has sections like "governance", "management", etc.
-            - Be sure to search for all the categories of insiders (see **context** section).
-            - For each result output the exact source were you found the information
-            - Avoid duplicated results, add multiple sources instead.
-            - DO NOT crawl PDF files or corporate governance reports.
-            - When you have crawled 20 URLs you have to stop and return the results. Use the **reasoning_tools** to decide if you have to stop or not.
-            - If you DO NOT find any insider return an empty string.
-            </considerations>
-        """
-        ),
-        debug_mode=True,
-        show_tool_calls=True,
-        tool_call_limit=50,
-        exponential_backoff=True,
-        retries=3,
-        use_json_mode=True,
-        response_model=SearchResults,
-    )
+    @cached_property
+    def insiders_web_agent(self) -> Agent:
+        """An agent to search the insiders on the web, built on first use."""
+        return Agent(
+            name="Insiders Crawl Agent",
+            model=Gemini(
+                id="gemini-2.5-flash",
+                temperature=0.1,
+                top_p=0.95,
+                client_params=GEMINI_CLIENT_PARAMS,
+            ),
+            tools=[
+                GoogleSearchTools(
+                    fixed_max_results=5, cache_results=True
+                ),  # Cache results during testing
+                CrawlTools(max_length=25000, cache_results=True, governance_mode=False),
+                ReasoningTools(add_instructions=True),
+            ],
+            system_message=INSIDERS_WEB_SYSTEM_MESSAGE,
+            debug_mode=True,
+            show_tool_calls=True,
+            tool_call_limit=15,
+            exponential_backoff=True,
+            retries=3,
+            use_json_mode=True,
+            response_model=SearchResults,
+        )
 
     def run(self, company_name: str) -> Iterator[RunResponse]:
         """
         Run the insiders search workflow.
         """
 
-        governance_report_agent_response = self.governance_report_agent.run(
-            f"Please search the web to find the latest governance report of the company {company_name} and extract all the insiders and informations related.",
-        )
+        # The two agents search independent sources, so they run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            governance_future = executor.submit(
+                self._run_agent,
+                self.governance_report_agent,
+                f"Please search the web to find the latest governance report of the company {company_name} and extract all the insiders and informations related.",
+            )
+            web_search_future = executor.submit(self._get_web_search, company_name)
+            governance_report_agent_response = governance_future.result()
+            web_search_results = web_search_future.result()
 
         if not isinstance(
             governance_report_agent_response.content, GovernanceReportResults
@@ -259,14 +209,7 @@ class InsidersWorkflow(Workflow):
                 content="Failed to crawl governance report.",
             )
 
-        # Sleep for 15 seconds to avoid rate limiting issues
-        time.sleep(15)
-
-        insiders_web_agent_response = self.insiders_web_agent.run(
-            f"Please search the web to find all the insiders of the company {company_name} and extract all the insiders and informations related.",
-        )
-
-        if not isinstance(insiders_web_agent_response.content, SearchResults):
+        if web_search_results is None:
             log_warning(
                 f"Insiders web agent failed to find insiders for {company_name}."
             )
@@ -280,19 +223,158 @@ class InsidersWorkflow(Workflow):
         results_data = {
             "company_name": company_name,
             "timestamp": datetime.now().isoformat(),
-            "governance_report": governance_report_agent_response.content.model_dump(),
-            "web_search": insiders_web_agent_response.content.model_dump(),
+            "governance_report": governance_report_agent_response.content,
+            "web_search": web_search_results,
             "status": "success",
         }
 
         filename = f"{company_name.replace(' ', '_').lower()}_insiders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         filepath = os.path.join("../results", filename)
 
-        with open(filepath, "w") as f:
-            json.dump(results_data, f, indent=2, ensure_ascii=False)
+        # pydantic-core serializes the models directly to UTF-8 bytes, without model_dump
+        with open(filepath, "wb") as f:
+            f.write(to_json(results_data, indent=2))
 
         print(f"\nResults saved to: {filepath}")
 
         return RunResponse(
             content="Workflow completed successfully.",
-        )
\ No newline at end of file
+        )
+
+    def _run_agent(self, agent: Agent, prompt: str) -> RunResponse:
+        """Run an agent once the rate limiter allows it."""
+        with self.run_limiter:
+            return agent.run(prompt)
+
+    def _get_web_search(self, company_name: str) -> Optional[SearchResults]:
+        """
+        Returns the cached web search results of a company, searching the web on a miss.
+
+        Args:
+            company_name (str): The name of the company.
+
+        Returns:
+            Optional[SearchResults]: The results, or None if nothing was found.
+        """
+        web_search_results = self._get_cached_web_search(company_name)
+        if web_search_results is None:
+            web_search_results = self._search_insiders(company_name)
+            if web_search_results is not None:
+                self._cache_web_search(company_name, web_search_results)
+        return web_search_results
+
+    def _search_insiders(self, company_name: str) -> Optional[SearchResults]:
+        """
+        Runs the web agent one search iteration at a time, with a compact memory.
+
+        Each run starts from a fresh context holding only the insiders found so far,
+        instead of every previously crawled page. The loop ends when the belief
+        state reports that no new insiders are being found.
+
+        Args:
+            company_name (str): The name of the company.
+
+        Returns:
+            Optional[SearchResults]: The merged results, or None if nothing was found.
+        """
+        self.insiders_belief.reset()
+        memory: Dict[str, SearchResult] = {}  # Insiders found so far, by normalized name
+        sources: Dict[str, List[str]] = {}
+
+        for iteration in range(MAX_SEARCH_ITERATIONS):
+            prompt = f"Please search the web to find all the insiders of the company {company_name} and extract all the insiders and informations related."
+            if memory:
+                summary = [
+                    {
+                        "name": result.insider.name,
+                        "roles": [r.role_name for r in result.insider.roles or []],
+                        "sources": sources[key],
+                    }
+                    for key, result in memory.items()
+                ]
+                prompt += f"\n\nInsiders found so far:\n{json.dumps(summary, ensure_ascii=False, separators=(',', ':'))}"
+
+            response = self._run_agent(self.insiders_web_agent, prompt)
+            if not isinstance(response.content, SearchResults):
+                log_warning(f"Web search iteration {iteration + 1} returned no results.")
+                break
+
+            categories: Dict[str, List[str]] = {c: [] for c in InsidersBelief.CATEGORIES}
+            new_names: List[str] = []
+            for result in response.content.results or []:
+                name = result.insider.name
+                if not name:
+                    continue
+                key = " ".join(name.casefold().split())
+                if key in memory:
+                    known_roles = memory[key].insider.roles or []
+                    role_names = {r.role_name for r in known_roles}
+                    known_roles.extend(
+                        r for r in result.insider.roles or [] if r.role_name not in role_names
+                    )
+                    memory[key].insider.roles = known_roles
+                else:
+                    memory[key] = result
+                    sources[key] = []
+                    new_names.append(name)
+                if result.source and result.source not in sources[key]:
+                    sources[key].append(result.source)
+                categories[_get_insider_category(result.insider)].append(name)
+
+            # Surface each iteration's validated results right away
+            if new_names:
+                log_info(
+                    f"Iteration {iteration + 1}: found {len(new_names)} new insiders: {', '.join(new_names)}"
+                )
+
+            status = self.insiders_belief.record_iteration(**categories)
+            if status["status"] == "stop":
+                break
+
+        if not memory:
+            return None
+
+        for key, result in memory.items():
+            result.source = ", ".join(sources[key])
+        return SearchResults(results=list(memory.values()))
+
+    def _get_cache_path(self, company_name: str) -> str:
+        key = hashlib.sha256(_normalize_company_name(company_name).encode()).hexdigest()
+        return os.path.join(CACHE_DIR, f"{key}.json")
+
+    def _get_cached_web_search(self, company_name: str) -> Optional[SearchResults]:
+        """
+        Return the cached web search results for the company, if still fresh.
+
+        Args:
+            company_name (str): The name of the company.
+
+        Returns:
+            Optional[SearchResults]: The cached results, or None on a miss.
+        """
+        cache_path = self._get_cache_path(company_name)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > CACHE_TTL:
+                return None
+            with open(cache_path, "r") as f:
+                results = SearchResults.model_validate(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+        log_debug(f"Using cached web search results for {company_name}.")
+        return results
+
+    def _cache_web_search(self, company_name: str, results: SearchResults) -> None:
+        """
+        Store the web search results for the company.
+
+        Args:
+            company_name (str): The name of the company.
+            results (SearchResults): The results to cache.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        try:
+            with open(self._get_cache_path(company_name), "w") as f:
+                f.write(results.model_dump_json())
+        except OSError as e:
+            log_warning(f"Unable to cache web search results: {e}")
@@ -1,17 +1,24 @@
+import hashlib
 import os
+import random
 import re
+import sys
 import tempfile
 import time
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 from agno.agent import Agent
 from agno.workflow import RunResponse, Workflow
 from agno.utils.log import logger
-import requests
+import httpx
+from pydantic_core import from_json, to_json
 import urllib3
 
 from agents.report_search_agent import ReportSearchAgent
@@ -21,35 +28,245 @@ from agents.validation_agent import ValidationAgent
 from models.report import Report
 
 from db.driver import DBDriver
-from exceptions.exceptions import WorkflowException
+from tools._http import USER_AGENT, aclose_async_client, get_async_client
+from tools._rate_limit import AdaptiveLimiter
+from exceptions.exceptions import AgentException, WorkflowException
 
 from unstructured.partition.auto import partition
 from unstructured.partition.pdf import partition_pdf
 from unstructured.partition.html import partition_html
 from unstructured.chunking.basic import chunk_elements
-from unstructured.cleaners.core import clean
 from unstructured.cleaners.core import group_broken_paragraphs
-from unstructured.cleaners.core import clean_non_ascii_chars
+from unstructured.nlp.patterns import E_BULLET_PATTERN, UNICODE_BULLETS_RE
 
-from models.report_results import ReportResults
+from models.report_results import ReportResults, upgrade_person_to_insider
 
-from thefuzz import fuzz
+import numpy as np
+from rapidfuzz import process, utils
+from rapidfuzz.fuzz import ratio, token_set_ratio, token_sort_ratio
 from playwright.async_api import async_playwright
 
+# A PDF larger than this yielding fewer elements with the fast strategy is treated as scanned
+SCANNED_PDF_MIN_BYTES = 500 * 1024
+SCANNED_PDF_MAX_ELEMENTS = 20
+# A PDF whose text layer holds fewer characters than this is treated as scanned
+SCANNED_PDF_MIN_CHARS = 500
+
+# Attempts at the final agent calls, waiting exponentially longer (with jitter) in between
+AGENT_RETRIES = 3
+RETRY_MAX_DELAY = 10.0
+
+# Downloads are written to disk in chunks of this size instead of buffered whole
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+# Larger PDFs fetched through the browser are saved as downloads rather than read in memory
+BROWSER_BODY_MAX_BYTES = 8 * 1024 * 1024
+
+# Bump when the shape of the cached analysis results changes, to drop the old entries
+CACHE_SCHEMA_VERSION = "2"
+
+# Merged results of already analyzed reports, keyed by the SHA-256 of the report file
+# and of the analysis settings (see _get_results_cache_path)
+RESULTS_CACHE_DIR = os.path.join(".insiders_cache", "reports")
+RESULTS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Analysis results of single batches of chunks, keyed by the SHA-256 of their texts
+# and of the analysis settings (see _get_texts_hash)
+CHUNK_CACHE_DIR = os.path.join(".insiders_cache", "chunks")
+
+# Element count from which cleaning is spread over worker processes
+PARALLEL_CLEAN_MIN_ELEMENTS = 5000
+
+# Shortest repeated text taken as the chunker overlap between two consecutive chunks
+MIN_OVERLAP_CHARS = 20
+
+# Dashes, line breaks and runs of spaces all collapse to a single space
+_SEPARATORS_RE = re.compile(r"[-\u2013\xa0\n ]+")
+_E_BULLET_RE = re.compile(E_BULLET_PATTERN)
+
+# Used by _normalize_str for every fuzzy comparison
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Role qualifiers ignored when comparing edge properties, longer alternatives first
+_ROLE_QUALIFIERS_RE = re.compile(r"non-executive|non-independent|independent|executive")
+
+
+def _strip_overlap(previous: str, text: str, overlap: int) -> str:
+    """Drops the start of text that repeats the end of previous, as added by the chunker overlap."""
+    tail = previous[-overlap:]
+    for start in range(len(tail) - MIN_OVERLAP_CHARS + 1):
+        if text.startswith(tail[start:]):
+            return text[len(tail) - start :].lstrip()
+    return text
+
+
+def _is_overloaded_error(error: BaseException) -> bool:
+    """Whether the error, or one it was raised from, is a 429 or 5xx from the provider."""
+    while error is not None:
+        code = getattr(error, "status_code", None) or getattr(error, "code", None)
+        if isinstance(code, int) and (code == 429 or code >= 500):
+            return True
+        if "RESOURCE_EXHAUSTED" in str(error):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _is_challenge_page(html: str) -> bool:
+    """Whether the HTML is a WAF/captcha challenge instead of the requested page."""
+    return (
+        "_Incapsula_Resource" in html
+        or "visid_incap" in html
+        or "Request unsuccessful" in html
+        or "captcha" in html.lower()
+    )
+
+
+def _clean_text(text: str) -> str:
+    """
+    Cleans an element text in a single pass.
+
+    Same result as `clean(bullets=True, extra_whitespace=True, dashes=True)`, then
+    `group_broken_paragraphs` and `clean_non_ascii_chars` from unstructured.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        str: The cleaned text.
+    """
+    text = _SEPARATORS_RE.sub(" ", text).strip()
+    if not text:
+        return text
+    if UNICODE_BULLETS_RE.match(text):
+        text = UNICODE_BULLETS_RE.sub("", text, 1).strip()
+    # Without line breaks left, grouping only changes texts that still start with a bullet
+    if UNICODE_BULLETS_RE.match(text) or _E_BULLET_RE.match(text):
+        text = group_broken_paragraphs(text)
+    # Most report text is plain ASCII already, which isascii() tells without copying
+    return text if text.isascii() else text.encode("ascii", "ignore").decode()
+
+
+# Combined node similarity (70% ID, 30% comparison string) needed to merge two nodes
+MATCH_THRESHOLD = 80
+# Lowest rounded ID score that can still reach MATCH_THRESHOLD: 0.7 * 72 + 30 >= 80
+MIN_ID_SCORE = 72
+
+# Properties identifying a node of each label, in comparison string order
+_COMPARISON_KEYS = {
+    "person": ("name",),
+    "company": ("name",),
+    "committee": ("name",),
+    "auditor": ("name",),
+    "board": ("type",),
+    "insider": ("firstName", "lastName"),
+    "address": ("street", "city", "postalCode", "country"),
+}
+
+# Date keys don't make two edges comparable
+_EDGE_DATE_KEYS = frozenset(("from", "to"))
+
+
+def _get_properties_signature(properties: Dict) -> Tuple[Optional[int], frozenset]:
+    """
+    Computes the fingerprint and the comparable keys of an edge's properties.
+
+    Args:
+        properties (Dict): The edge properties.
+
+    Returns:
+        Tuple[Optional[int], frozenset]: The hash of the properties, or None if a value
+        is unhashable, and their keys without the dates.
+    """
+    try:
+        fingerprint = hash(frozenset(properties.items()))
+    except TypeError:
+        fingerprint = None
+    return fingerprint, frozenset(properties) - _EDGE_DATE_KEYS
+
+
+@lru_cache(maxsize=8192)
+def _normalize_text(text: str) -> str:
+    """
+    Normalizza una stringa per il confronto (strip, lower, senza punteggiatura e
+    whitespace multipli). I valori si ripetono tra nodi e archi, quindi è in cache.
+    """
+    s = text.strip().lower()
+    # rimuovi punteggiatura comune mantenendo lettere/numeri/spazi
+    s = _PUNCTUATION_RE.sub(" ", s)
+    # collassa più spazi in uno
+    return _WHITESPACE_RE.sub(" ", s).strip()
+
+
+@lru_cache(maxsize=8192)
+def _strip_role_qualifiers(text: str) -> str:
+    """Rimuove i qualificatori di ruolo (es. "independent") da una stringa normalizzata."""
+    return _ROLE_QUALIFIERS_RE.sub("", text)
+
+
+@lru_cache(maxsize=8192)
+def _get_tokens(text: str) -> frozenset:
+    """Restituisce i token di una stringa come li vede il processor di RapidFuzz."""
+    return frozenset(utils.default_process(text).split())
+
+
+@lru_cache(maxsize=8192)
+def _compare_values(s1: str, s2: str) -> Optional[bool]:
+    """
+    Confronta due valori normalizzati senza lo scorer fuzzy.
+
+    Restituisce True o False se il confronto è già deciso, None se serve token_set_ratio.
+    """
+    if s1 == s2 or _strip_role_qualifiers(s1) == _strip_role_qualifiers(s2):
+        return True
+    # An empty value scores 0; the length ratio is no bound for
+    # token_set_ratio, which scores 100 when one value's tokens are a subset
+    if not s1 or not s2:
+        return False
+    t1, t2 = _get_tokens(s1), _get_tokens(s2)
+    if t1 and t2 and (t1 <= t2 or t2 <= t1):
+        return True
+    return None
+
+
+def _get_sort_key(text: str) -> str:
+    """Restituisce i token ordinati di una stringa, come li confronta token_sort_ratio."""
+    return " ".join(sorted(utils.default_process(text).split()))
+
 
 class InsidersWorkflow(Workflow):
     """
     A multi agent workflow designed to search and ingest corporate governance report data into a knowledge graph.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        auto_confirm: bool = False,
+        save_db: bool = False,
+        save_local: bool = False,
+        use_batch_api: bool = False,
+        confirm: Optional[Callable[[str], Awaitable[bool]]] = None,
+    ):
         super().__init__()
+        self.auto_confirm = auto_confirm  # Proceed without asking for confirmation
+        self.confirm = confirm  # Answers the questions instead of the stdin prompt
+        self.save_db = save_db  # Save the results to the database without asking
+        self.save_local = save_local  # Save the results locally without asking
+        self.use_batch_api = use_batch_api  # Analyze all chunks in one Batch API job
         self.max_characters = 55000  # Max characters per chunk
         self.overlap = 100  # Overlap between chunks
-        self.max_concurrent = 5  # Max concurrent chunk analyses
-        self.semaphore = asyncio.Semaphore(
-            self.max_concurrent
-        )  # Semaphore for limiting concurrency during chunk analysis
+        self.max_concurrent = int(
+            os.getenv("INSIDERS_MAX_CONCURRENT", "16")
+        )  # Initial concurrent chunk analyses, the requests only wait on LLM I/O
+        self.max_concurrent_limit = int(
+            os.getenv("INSIDERS_MAX_CONCURRENT_LIMIT", "64")
+        )  # Upper bound the concurrency grows to while the provider keeps up
+        self.chunks_per_request = 2  # Consecutive chunks analyzed in one request
+        # Playwright browser reused across downloads, launched on first use
+        self._playwright = None
+        self._browser = None
+        self._browser_context = None
+        # Concurrent downloads wait for a single launch instead of starting their own
+        self._browser_lock = asyncio.Lock()
         self.report_search_agent: Agent = (
             ReportSearchAgent()
         )  # Agent to search for report URL
@@ -87,7 +304,33 @@ class InsidersWorkflow(Workflow):
             RunResponse: The response of the workflow containing the summarized results or error message.
         """
 
-        return asyncio.run(self._run_async(company_name, report_url))
+        async def run_and_close() -> RunResponse:
+            try:
+                # agno replaces self.arun with a keyword-only wrapper, call the body directly
+                return await self._run_async(company_name, report_url)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run_and_close())
+
+    async def arun(self, company_name: str, report_url: str) -> RunResponse:
+        """
+        Run the workflow for a target company on the running event loop.
+
+        Callers processing several companies can await (or gather) this method
+        on a single loop, instead of creating a new loop for every run. The browser
+        launched for the downloads and the database connection are shared across
+        runs, call aclose once all of them are done.
+
+        Args:
+            company_name (str): The name of the target company.
+            report_url (str): Optional direct URL to the corporate governance report in PDF format.
+
+        Returns:
+            RunResponse: The response of the workflow containing the summarized results or error message.
+        """
+
+        return await self._run_async(company_name, report_url)
 
     async def _run_async(self, company_name: str, report_url: str) -> RunResponse:
         """
@@ -95,7 +338,7 @@ class InsidersWorkflow(Workflow):
         1. Search for the corporate governance report URL.
         2. If URL found, partition the report into elements.
         3. Chunk the elements.
-        4. Analyze each chunk concurrently with a semaphore to limit concurrency.
+        4. Analyze the chunks concurrently, with at most max_concurrent requests in flight.
         5. Summarize the results from all chunks.
 
         Args:
@@ -116,40 +359,23 @@ class InsidersWorkflow(Workflow):
             raise WorkflowException(message)
 
         logger.info(f"Found report URL: {report_url}")
-        answer = input(
-            f"Do you want to proceed with the analysis? [Y/n] "
-        )  # Asks the user for confirmation to proceed
-        if not answer.lower() in ["y", "yes"]:
+        if not await self._confirm(
+            "Do you want to proceed with the analysis? [Y/n] ", self.auto_confirm
+        ):  # Asks the user for confirmation to proceed
             return RunResponse(content="Workflow interrupted.")
 
         logger.info(f"Processing report...")
 
         tmp_file_path = await self._download_report(report_url)
 
-        elements = self._partition_report(tmp_file_path)
-        logger.info(f"Partitioned report into {len(elements)} elements.")
-
-        self._clean_elements(elements)
-        logger.info(f"Cleaned report elements.")
-
-        chunks = self._chunk_elements(elements)
-        logger.info(f"Chunked report into {len(chunks)} chunks.")
-
-        logger.info(f"Processing chunks with max concurrency {self.max_concurrent}...")
-
-        start_time = time.time()
-        chunks_results = await self._process_chunks(chunks)  # Analyze chunks in batches
-        end_time = time.time()
-
-        analysis_duration = end_time - start_time
-        success_chunks = [chunk for chunk in chunks_results if chunk.get("result")]
-
-        logger.info(
-            f"Chunk analysis completed in {analysis_duration:.2f} seconds. \
-                Total chunks: {len(chunks_results)}. Success: {len(success_chunks)}. Failed: {len(chunks_results) - len(success_chunks)}"
-        )
-
-        merged_results = self._collect_chunks_results(success_chunks)
+        # The same report is never analyzed twice, whatever URL it was downloaded from
+        report_hash = await asyncio.to_thread(self._hash_file, tmp_file_path)
+        merged_results = self._get_cached_results(report_hash)
+        if merged_results is not None:
+            os.unlink(tmp_file_path)
+            logger.info(f"Using cached results for report {report_hash[:12]}.")
+        else:
+            merged_results = await self._analyze_report(tmp_file_path, report_hash)
 
         self._print_results_summary(ReportResults(**merged_results))
 
@@ -158,7 +384,9 @@ class InsidersWorkflow(Workflow):
         )
 
         logger.info(f"Validating final results...")
-        final_results: ReportResults = self._validate_results(merged_results)
+        # The analysis prompt still emits the legacy Person schema
+        merged_results = upgrade_person_to_insider(merged_results)
+        final_results: ReportResults = await self._validate_results(merged_results)
 
         logger.info(
             f"Final results validated. Nodes: {len(final_results.nodes)}, Edges: {len(final_results.edges)}"
@@ -169,19 +397,89 @@ class InsidersWorkflow(Workflow):
 
         self._add_source_to_results(final_results, report_url)
 
-        answer = input(f"Do you want to save the results to the database? [Y/n] ")
-        if answer.lower() in ["y", "yes"]:
+        if await self._confirm(
+            "Do you want to save the results to the database? [Y/n] ", self.save_db
+        ):
             self.db.save_report_results(final_results)
-            self.db.close()
             logger.info(f"Results saved to the database.")
 
-        answer = input(f"Do you want to save the results locally? [Y/n] ")
-        if answer.lower() in ["y", "yes"]:
-            path = self._save_results_locally(final_results, company_name)
+        if await self._confirm(
+            "Do you want to save the results locally? [Y/n] ", self.save_local
+        ):
+            if not company_name:
+                company_name = urlparse(report_url).netloc
+            path = await asyncio.to_thread(
+                self._save_results_locally, final_results, company_name
+            )
             logger.info(f"Results saved to {path}.")
 
         return RunResponse(content="Workflow completed successfully.")
 
+    async def _analyze_report(self, tmp_file_path: str, report_hash: str) -> Dict:
+        """
+        Analyzes the report chunks and merges their results, caching them when all chunks succeed.
+
+        Args:
+            tmp_file_path (str): Path to the temporary file containing the report.
+            report_hash (str): The SHA-256 of the report file.
+
+        Returns:
+            Dict: The merged results containing unique nodes and edges.
+        """
+        logger.info(f"Processing chunks with max concurrency {self.max_concurrent}...")
+
+        start_time = time.time()
+        # Each result is merged as soon as it arrives, while the other requests are in flight
+        merge_state = self._new_merge_state()
+        total_requests = success_requests = 0
+        async for res in self._process_report(tmp_file_path):
+            total_requests += 1
+            if res.get("result"):
+                success_requests += 1
+                self._merge_single_result(res, merge_state)
+        end_time = time.time()
+
+        analysis_duration = end_time - start_time
+        # Observed request rate, to tune max_concurrent against the provider limits
+        requests_per_minute = total_requests * 60 / max(analysis_duration, 1e-6)
+        logger.info(f"Chunk analysis rate: {requests_per_minute:.1f} requests/minute.")
+
+        logger.info(
+            f"Chunk analysis completed in {analysis_duration:.2f} seconds. \
+                Total requests: {total_requests}. Success: {success_requests}. Failed: {total_requests - success_requests}"
+        )
+
+        merged_results = self._get_merged_results(merge_state)
+        # A partial analysis is not cached, so the next run retries the failed chunks
+        if total_requests and success_requests == total_requests:
+            self._cache_results(report_hash, merged_results)
+        return merged_results
+
+    async def _confirm(self, question: str, flag: bool) -> bool:
+        """
+        Asks the user a yes/no question, unless the answer was given on the command line.
+
+        The question goes to the confirm callback when one was given, so workflows run
+        side by side don't compete for stdin. Otherwise the prompt is read in a worker
+        thread, so the event loop keeps running meanwhile.
+
+        Args:
+            question (str): The question to ask.
+            flag (bool): Whether the answer was already given as yes.
+
+        Returns:
+            bool: Whether the answer is yes. Always False when running with auto_confirm
+            and the flag is not set.
+        """
+        if flag:
+            return True
+        if self.auto_confirm:
+            return False
+        if self.confirm is not None:
+            return await self.confirm(question)
+        answer = await asyncio.to_thread(input, question)
+        return answer.lower() in ["y", "yes"]
+
     def _print_results_summary(self, results: ReportResults) -> None:
         """
         Prints a summary of the results.
@@ -192,19 +490,24 @@ class InsidersWorkflow(Workflow):
         Returns:
             None
         """
-        nodes = sorted(results.nodes, key=lambda n: n.label)
-        edges = sorted(results.edges, key=lambda e: e.type)
+        nodes = sorted(results.nodes, key=attrgetter("label"))
+        edges = sorted(results.edges, key=attrgetter("type"))
 
         def print_properties(props: Dict) -> str:
             return ", ".join(f"{k}: {v}" for k, v in props.items())
 
-        print(f"\nNodes: {len(nodes)}")
-        for n in nodes:
-            print(f"ID: {n.id} label: {n.label} {print_properties(n.properties)}")
-
-        print(f"\nEdges: {len(edges)}")
-        for e in edges:
-            print(f"{e.source} -[{e.type}]-> {e.dest} {print_properties(e.properties)}")
+        # The whole summary is rendered first and written at once
+        lines = [f"\nNodes: {len(nodes)}"]
+        lines.extend(
+            f"ID: {n.id} label: {n.label} {print_properties(n.properties)}"
+            for n in nodes
+        )
+        lines.append(f"\nEdges: {len(edges)}")
+        lines.extend(
+            f"{e.source} -[{e.type}]-> {e.dest} {print_properties(e.properties)}"
+            for e in edges
+        )
+        print("\n".join(lines))
 
     def _get_report_url(self, company_name: str) -> str:
         """
@@ -240,10 +543,98 @@ class InsidersWorkflow(Workflow):
         os.makedirs("results/v4", exist_ok=True)
         filename = f"{company_name.replace(' ', '_').lower()}_insiders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         filepath = os.path.join("results/v4", filename)
-        with open(filepath, "w") as f:
-            f.write(results.model_dump_json(indent=2))
+        # pydantic-core writes UTF-8 bytes directly, without an intermediate str
+        with open(filepath, "wb") as f:
+            f.write(to_json(results, indent=2))
         return filepath
 
+    def _hash_file(self, file_path: str) -> str:
+        """
+        Computes the SHA-256 of a file, reading it in chunks.
+
+        Args:
+            file_path (str): The path of the file.
+
+        Returns:
+            str: The hex digest.
+        """
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _get_results_cache_path(self, report_hash: str) -> str:
+        """
+        Returns the cache path of the merged results of a report.
+
+        The key also covers the cache schema version, the analyze agent's model and
+        prompts and the chunking parameters, so changing any of them misses the cache.
+
+        Args:
+            report_hash (str): The SHA-256 of the report file.
+
+        Returns:
+            str: The path of the cache entry.
+        """
+        key = "\0".join(
+            (
+                report_hash,
+                CACHE_SCHEMA_VERSION,
+                self.report_analyze_agent.fingerprint,
+                str(self.max_characters),
+                str(self.overlap),
+                str(self.chunks_per_request),
+            )
+        )
+        return os.path.join(
+            RESULTS_CACHE_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        )
+
+    def _get_cached_results(self, report_hash: str) -> Optional[Dict]:
+        """
+        Returns the cached merged results of a report, if it was already analyzed.
+
+        Args:
+            report_hash (str): The SHA-256 of the report file.
+
+        Returns:
+            Optional[Dict]: The cached results, or None on a miss.
+        """
+        cache_path = self._get_results_cache_path(report_hash)
+        try:
+            with open(cache_path, "rb") as f:
+                results = from_json(f.read())
+            os.utime(cache_path)  # Marks the entry as recently used
+        except (OSError, ValueError):
+            return None
+        return results
+
+    def _cache_results(self, report_hash: str, results: Dict) -> None:
+        """
+        Stores the merged results of a report, evicting the least recently used
+        entries once the cache exceeds RESULTS_CACHE_MAX_BYTES.
+
+        Args:
+            report_hash (str): The SHA-256 of the report file.
+            results (Dict): The merged results to cache.
+        """
+        try:
+            os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+            with open(self._get_results_cache_path(report_hash), "wb") as f:
+                f.write(to_json(results))
+
+            entries = sorted(
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(RESULTS_CACHE_DIR)
+                if entry.name.endswith(".json")
+            )
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total_size <= RESULTS_CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total_size -= size
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Unable to cache report results: {e}")
+
     async def _download_report(self, report_url: str) -> str:
         """
         Download the report using Playwright Async API and save to a temporary file.
@@ -255,28 +646,26 @@ class InsidersWorkflow(Workflow):
             str: The path to the temporary file containing the downloaded report.
         """
         tmp_file_path = None
-        origin = f"{urlparse(report_url).scheme}://{urlparse(report_url).netloc}"
+        parsed_url = urlparse(report_url)
+        origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
         # suppress insecure request warnings for fallback fetch
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--ignore-ssl-errors", "--ignore-certificate-errors"],
-                )
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    ignore_https_errors=True,
-                )
-                page = await context.new_page()
+        # Most reports don't need a browser, which takes seconds just to start
+        tmp_file_path = await self._download_direct(report_url)
+        if tmp_file_path:
+            return tmp_file_path
 
+        try:
+            context = await self._get_browser_context()
+            page = await context.new_page()
+            try:
                 # Try a navigation to detect WAF/challenge (don't rely on it for PDF body)
                 resp = None
                 try:
                     resp = await page.goto(
-                        report_url, wait_until="networkidle", timeout=30000
+                        report_url, wait_until="domcontentloaded", timeout=15000
                     )
                 except Exception as e:
                     # navigation for PDF often raises ERR_ABORTED; swallow and continue to detection/fetch
@@ -313,39 +702,55 @@ class InsidersWorkflow(Workflow):
                         f"WAF/challenge detected for {report_url}, doing origin pre-flight {origin}"
                     )
                     try:
-                        await page.goto(origin, wait_until="networkidle", timeout=45000)
+                        await page.goto(
+                            origin, wait_until="domcontentloaded", timeout=15000
+                        )
                         for pth in ["/", "/en", "/it"]:
                             try:
                                 await page.goto(
                                     origin.rstrip("/") + pth,
-                                    wait_until="networkidle",
-                                    timeout=20000,
+                                    wait_until="domcontentloaded",
+                                    timeout=15000,
                                 )
                             except Exception:
                                 pass
+                        # Give the challenge script a moment to set its cookies
+                        try:
+                            await page.wait_for_load_state("load", timeout=5000)
+                        except Exception:
+                            pass
                     except Exception as e:
                         logger.warning(f"Pre-flight origin visit failed: {e}")
 
+                # The API request buffers the whole body, large PDFs are streamed to
+                # disk by a browser download instead
+                if await self._is_large_pdf(context, report_url):
+                    tmp_file_path = await self._save_browser_download(page, report_url)
+
                 # Prefer context.request.get to fetch the raw resource (works for PDFs)
                 response = None
-                try:
-                    response = await context.request.get(report_url, timeout=60000)
-                    logger.info(
-                        f"context.request.get response status: {getattr(response, 'status', None)}"
-                    )
-                except Exception as e:
-                    logger.debug(f"context.request.get failed: {e}")
-                    response = None
+                if tmp_file_path is None:
+                    try:
+                        response = await context.request.get(report_url, timeout=60000)
+                        logger.info(
+                            f"context.request.get response status: {getattr(response, 'status', None)}"
+                        )
+                    except Exception as e:
+                        logger.debug(f"context.request.get failed: {e}")
+                        response = None
 
                 data = None
                 suffix = ""
-                if response is not None and 200 <= response.status < 300:
+                if tmp_file_path is not None:
+                    suffix = ".pdf"
+                elif response is not None and 200 <= response.status < 300:
                     ctype = (response.headers.get("content-type") or "").lower()
                     if "application/pdf" in ctype or report_url.lower().endswith(
                         ".pdf"
                     ):
-                        data = await response.body()
                         suffix = ".pdf"
+                        data = await response.body()
+                        await response.dispose()
                     elif "text/html" in ctype or report_url.lower().endswith(".html"):
                         txt = await response.text()
                         data = txt.encode("utf-8")
@@ -360,52 +765,53 @@ class InsidersWorkflow(Workflow):
 
                 else:
                     # If Playwright failed and the failure looks like a cert issue or context.request failed,
-                    # try a simple requests.get fallback (disable SSL verification).
+                    # try a plain HTTP fallback on the pooled client (SSL verification disabled).
                     tried_requests_fallback = False
                     if response is None:
-                        err_msg = ""
-                        # If we have debug log of earlier exception, check for certificate text in it
                         # fall back unconditionally when context.request.get didn't succeed
                         try:
                             logger.info(
-                                "Attempting requests fallback with verify=False due to Playwright request failure."
+                                "Attempting HTTP fallback with verify=False due to Playwright request failure."
                             )
-                            headers = {
-                                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                            }
-                            r = requests.get(
-                                report_url, headers=headers, timeout=60, verify=False
-                            )
-                            tried_requests_fallback = True
-                            if 200 <= r.status_code < 300:
-                                ctype = (r.headers.get("content-type") or "").lower()
-                                if (
-                                    "application/pdf" in ctype
-                                    or report_url.lower().endswith(".pdf")
-                                ):
-                                    data = r.content
-                                    suffix = ".pdf"
-                                elif (
-                                    "text/html" in ctype
-                                    or report_url.lower().endswith(".html")
-                                ):
-                                    data = r.text.encode("utf-8")
-                                    suffix = ".html"
+                            async with get_async_client().stream(
+                                "GET",
+                                report_url,
+                                headers={"User-Agent": USER_AGENT},
+                                timeout=60.0,
+                            ) as r:
+                                tried_requests_fallback = True
+                                if 200 <= r.status_code < 300:
+                                    ctype = (r.headers.get("content-type") or "").lower()
+                                    if (
+                                        "application/pdf" in ctype
+                                        or report_url.lower().endswith(".pdf")
+                                    ):
+                                        suffix = ".pdf"
+                                    elif (
+                                        "text/html" in ctype
+                                        or report_url.lower().endswith(".html")
+                                    ):
+                                        suffix = ".html"
+                                    tmp_file_path = await self._stream_to_tmp_file(
+                                        r, suffix
+                                    )
                                 else:
-                                    data = r.content
-                            else:
-                                logger.debug(
-                                    f"requests fallback returned status {r.status_code}"
-                                )
+                                    logger.debug(
+                                        f"HTTP fallback returned status {r.status_code}"
+                                    )
                         except Exception as e:
-                            logger.debug(f"requests fallback failed: {e}")
+                            logger.debug(f"HTTP fallback failed: {e}")
                             tried_requests_fallback = False
 
-                    if (data is None) and (not tried_requests_fallback):
+                    if (
+                        (data is None)
+                        and (tmp_file_path is None)
+                        and (not tried_requests_fallback)
+                    ):
                         # Last-resort fallback: try a lighter navigation and grab page content
                         try:
                             resp2 = await page.goto(
-                                report_url, wait_until="domcontentloaded", timeout=30000
+                                report_url, wait_until="domcontentloaded", timeout=15000
                             )
                             # try to detect pdf by headers if present
                             ctype = ""
@@ -424,19 +830,16 @@ class InsidersWorkflow(Workflow):
                             message = f"Unable to fetch report after retries: {e}"
                             raise WorkflowException(message) from e
 
-                # write to temp file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=suffix
-                ) as tmp_file:
-                    tmp_file.write(data or b"")
-                    tmp_file_path = tmp_file.name
-
+                # write to temp file, unless the fallback already streamed it there
+                if tmp_file_path is None:
+                    with tempfile.NamedTemporaryFile(
+                        delete=False, suffix=suffix
+                    ) as tmp_file:
+                        tmp_file.write(data or b"")
+                        tmp_file_path = tmp_file.name
+            finally:
                 try:
-                    await context.close()
-                except Exception:
-                    pass
-                try:
-                    await browser.close()
+                    await page.close()
                 except Exception:
                     pass
         except Exception as e:
@@ -448,10 +851,187 @@ class InsidersWorkflow(Workflow):
             )
         return tmp_file_path
 
+    async def _get_browser_context(self):
+        """
+        Returns the browser context used for the downloads, launching Chromium on first use.
+
+        The browser stays open across downloads until aclose is called.
+
+        Returns:
+            BrowserContext: The Playwright browser context.
+        """
+        if self._browser_context is not None:
+            return self._browser_context
+
+        async with self._browser_lock:
+            # Another download may have launched it while this one waited
+            if self._browser_context is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=["--ignore-ssl-errors", "--ignore-certificate-errors"],
+                )
+                self._browser_context = await self._browser.new_context(
+                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                    ignore_https_errors=True,
+                )
+        return self._browser_context
+
+    async def aclose(self) -> None:
+        """
+        Closes the browser used for the downloads, if it was launched, the HTTP client
+        of the running loop and the database connection.
+        """
+        for close in (
+            self._browser_context and self._browser_context.close,
+            self._browser and self._browser.close,
+            self._playwright and self._playwright.stop,
+        ):
+            if close:
+                try:
+                    await close()
+                except Exception:
+                    pass
+        self._playwright = self._browser = self._browser_context = None
+
+        await aclose_async_client()
+
+        try:
+            await asyncio.to_thread(self.db.close)
+        except Exception as e:
+            logger.warning(f"Unable to close the database connection: {e}")
+
+    async def _download_direct(self, report_url: str) -> Optional[str]:
+        """
+        Download a PDF or HTML report with a plain HTTP request, without a browser.
+
+        Args:
+            report_url (str): The URL of the report.
+
+        Returns:
+            Optional[str]: The path to the temporary file containing the report, or None
+            if the server answered with an error, a challenge page or another content type.
+        """
+        is_pdf_url = urlparse(report_url).path.lower().endswith(".pdf")
+        try:
+            async with get_async_client().stream(
+                "GET", report_url, headers={"User-Agent": USER_AGENT}, timeout=60.0
+            ) as r:
+                ctype = (r.headers.get("content-type") or "").lower()
+                if not (200 <= r.status_code < 300):
+                    logger.info(
+                        f"Direct download returned status {r.status_code}, falling back to the browser."
+                    )
+                    return None
+                if "application/pdf" in ctype or (is_pdf_url and "text/html" not in ctype):
+                    return await self._stream_to_tmp_file(r, ".pdf")
+                if "text/html" not in ctype:
+                    logger.info(
+                        f"Direct download returned {ctype or 'no content type'}, falling back to the browser."
+                    )
+                    return None
+
+                # HTML pages are small, read whole to look for WAF/challenge markers
+                html = (await r.aread()).decode(r.encoding or "utf-8", errors="replace")
+                if _is_challenge_page(html):
+                    logger.info("Direct download hit a WAF/challenge page, falling back to the browser.")
+                    return None
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as tmp_file:
+                    tmp_file.write(html.encode("utf-8"))
+                    return tmp_file.name
+        except Exception as e:
+            logger.debug(f"Direct download failed: {e}")
+            return None
+
+    async def _is_large_pdf(self, context, report_url: str) -> bool:
+        """
+        Whether a HEAD request through the browser context reports a PDF larger than
+        BROWSER_BODY_MAX_BYTES.
+
+        Args:
+            context (BrowserContext): The browser context, with the cookies of any WAF pre-flight.
+            report_url (str): The URL of the report.
+
+        Returns:
+            bool: True if the report should be saved as a browser download.
+        """
+        try:
+            head = await context.request.head(report_url, timeout=15000)
+        except Exception as e:
+            logger.debug(f"HEAD request through the browser failed: {e}")
+            return False
+        try:
+            ctype = (head.headers.get("content-type") or "").lower()
+            content_length = int(head.headers.get("content-length") or 0)
+            is_pdf = "application/pdf" in ctype or report_url.lower().endswith(".pdf")
+            return head.ok and is_pdf and content_length > BROWSER_BODY_MAX_BYTES
+        except ValueError:
+            return False
+        finally:
+            await head.dispose()
+
+    async def _save_browser_download(self, page, report_url: str) -> Optional[str]:
+        """
+        Downloads a report with the browser straight to a temporary file.
+
+        Args:
+            page (Page): The Playwright page, with the cookies of any WAF pre-flight.
+            report_url (str): The URL of the report.
+
+        Returns:
+            Optional[str]: The path to the temporary file, or None if no download started.
+        """
+        try:
+            async with page.expect_download(timeout=30000) as download_info:
+                try:
+                    await page.goto(report_url, timeout=30000)
+                except Exception:
+                    pass  # Navigations that turn into downloads are aborted
+            download = await download_info.value
+        except Exception as e:
+            logger.debug(f"Browser download failed: {e}")
+            return None
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+            tmp_file_path = tmp_file.name
+        try:
+            await download.save_as(tmp_file_path)
+        except Exception as e:
+            os.remove(tmp_file_path)
+            logger.debug(f"Saving the browser download failed: {e}")
+            return None
+        return tmp_file_path
+
+    async def _stream_to_tmp_file(self, response: httpx.Response, suffix: str) -> str:
+        """
+        Writes a streamed response body to a temporary file chunk by chunk.
+
+        Args:
+            response (httpx.Response): The open streamed response.
+            suffix (str): The suffix of the temporary file.
+
+        Returns:
+            str: The path to the temporary file.
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+            try:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                    tmp_file.write(chunk)
+            except BaseException:
+                tmp_file.close()
+                os.remove(tmp_file.name)
+                raise
+            return tmp_file.name
+
     def _partition_report(self, tmp_file_path: str) -> List:
         """
         Partitions the report into elements using unstructured library.
 
+        PDFs are read with the fast strategy, which extracts the text layer in seconds
+        but loses the table structure and finds no text in scanned pages. Only reports
+        that look scanned are partitioned again with the hi_res strategy, which runs
+        the layout and OCR models and can take minutes.
+
         Args:
             tmp_file_path (str): Path to the temporary file containing the report.
 
@@ -460,7 +1040,25 @@ class InsidersWorkflow(Workflow):
         """
         try:
             if tmp_file_path.endswith(".pdf"):
-                elements = partition_pdf(filename=tmp_file_path)
+                # Governance reports are text PDFs: read the text layer, no layout model
+                elements = partition_pdf(
+                    filename=tmp_file_path,
+                    strategy="fast",
+                    infer_table_structure=False,
+                    languages=["eng", "ita"],
+                )
+                total_chars = sum(len(el.text or "") for el in elements)
+                if total_chars < SCANNED_PDF_MIN_CHARS or (
+                    len(elements) < SCANNED_PDF_MAX_ELEMENTS
+                    and os.path.getsize(tmp_file_path) > SCANNED_PDF_MIN_BYTES
+                ):
+                    # Almost no text, or few elements from a large file: likely scanned, needs OCR
+                    logger.info("Report looks scanned, partitioning with hi_res strategy.")
+                    elements = partition_pdf(
+                        filename=tmp_file_path,
+                        strategy="hi_res",
+                        languages=["eng", "ita"],
+                    )
             elif tmp_file_path.endswith(".html"):
                 elements = partition_html(filename=tmp_file_path)
             else:
@@ -480,6 +1078,9 @@ class InsidersWorkflow(Workflow):
         """
         Cleans the elements by removing unwanted characters and grouping broken paragraphs.
 
+        Elements without text (figures, page breaks, empty headers) are removed first,
+        in place, so neither the cleaning nor the chunking sees them.
+
         Args:
             elements (List): List of elements to clean.
 
@@ -487,14 +1088,23 @@ class InsidersWorkflow(Workflow):
             None
         """
         try:
-            for (
-                el
-            ) in elements:  # Remove unwanted characters and group broken paragraphs
-                el.apply(
-                    lambda x: clean(x, bullets=True, extra_whitespace=True, dashes=True)
+            elements[:] = [el for el in elements if el.text and not el.text.isspace()]
+            if len(elements) < PARALLEL_CLEAN_MIN_ELEMENTS:
+                # Remove unwanted characters and group broken paragraphs
+                for el in elements:
+                    el.text = _clean_text(el.text)
+                return
+
+            # Regex cleaning holds the GIL, so large reports are cleaned in processes
+            workers = os.cpu_count() or 1
+            # A few batches per worker keeps the pickling round trips to a minimum
+            chunksize = max(256, -(-len(elements) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                cleaned = executor.map(
+                    _clean_text, [el.text for el in elements], chunksize=chunksize
                 )
-                el.apply(group_broken_paragraphs)
-                el.apply(clean_non_ascii_chars)
+                for el, text in zip(elements, cleaned):
+                    el.text = text
         except Exception as e:
             message = f"Error cleaning report elements."
             raise WorkflowException(message) from e
@@ -518,47 +1128,278 @@ class InsidersWorkflow(Workflow):
             message = f"Error chunking report elements."
             raise WorkflowException(message) from e
 
-    async def _process_chunks(self, chunks) -> List[Dict]:
+    def _prepare_chunks(self, tmp_file_path: str) -> List:
         """
-        Processes all chunks concurrently with a semaphore to limit concurrency.
+        Partitions, cleans and chunks the report. Blocking, runs in a worker thread.
 
         Args:
-            chunks (List): List of chunks to process.
+            tmp_file_path (str): Path to the temporary file containing the report.
 
         Returns:
-            List[Dict]: List of results from processing each chunk.
+            List: List of chunks.
         """
-        tasks = [
-            self._analyze_chunk_with_semaphore(index, chunk)
-            for index, chunk in enumerate(chunks)
-        ]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        elements = self._partition_report(tmp_file_path)
+        logger.info(f"Partitioned report into {len(elements)} elements.")
+
+        self._clean_elements(elements)
+        logger.info(f"Cleaned {len(elements)} report elements with text.")
+
+        chunks = self._chunk_elements(elements)
+        logger.info(f"Chunked report into {len(chunks)} chunks.")
+        return chunks
 
-    async def _analyze_chunk_with_semaphore(self, index: int, chunk) -> Dict:
+    def _deduplicate_chunks(self, chunks: List[Tuple[int, object]]) -> List[Tuple[int, object]]:
         """
-        Analyzes a single chunk with concurrency control using a semaphore.
+        Drops the chunks whose text repeats an earlier chunk, ignoring case and whitespace.
+
+        Repeated chunks would only yield the same nodes and edges again in the merge.
 
         Args:
-            index (int): The index of the chunk.
-            chunk: The chunk to analyze.
+            chunks (List[Tuple[int, object]]): The index and chunk of each chunk.
 
         Returns:
-            Dict: The result of the analysis or error information.
+            List[Tuple[int, object]]: The chunks with a distinct text, in order.
+        """
+        seen = set()
+        unique_chunks = []
+        for index, chunk in chunks:
+            key = hashlib.sha256(
+                " ".join(chunk.text.casefold().split()).encode()
+            ).digest()
+            if key in seen:
+                logger.info(f"Skipping chunk {index}, duplicate of an earlier chunk.")
+                continue
+            seen.add(key)
+            unique_chunks.append((index, chunk))
+        return unique_chunks
+
+    async def _process_report(self, tmp_file_path: str) -> AsyncIterator[Dict]:
+        """
+        Prepares the report chunks in a worker thread while a pool of consumers analyzes
+        them from a queue. The requests in flight start at max_concurrent, halve when the
+        provider answers 429 or 5xx and grow back up to max_concurrent_limit.
+
+        Args:
+            tmp_file_path (str): Path to the temporary file containing the report.
+
+        Yields:
+            Dict: The result of each analyzed batch, in completion order.
         """
-        async with self.semaphore:
+        if self.use_batch_api:
+            async for res in self._process_report_batch_api(tmp_file_path):
+                yield res
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        limiter = AdaptiveLimiter(self.max_concurrent, self.max_concurrent_limit)
+
+        def produce() -> None:
             try:
-                res = await self.report_analyze_agent.analyze_chunk_async(
-                    index, chunk.text
+                chunks = self._deduplicate_chunks(
+                    list(enumerate(self._prepare_chunks(tmp_file_path)))
                 )
-                print(f"""\n{'***'} Chunk:{index} {'***'}\n{res}""")
+                for start in range(0, len(chunks), self.chunks_per_request):
+                    batch = chunks[start : start + self.chunks_per_request]
+                    loop.call_soon_threadsafe(queue.put_nowait, batch)
+            finally:
+                # One sentinel per consumer, also when preparing the report failed
+                for _ in range(self.max_concurrent_limit):
+                    loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        async def consume() -> None:
+            while (batch := await queue.get()) is not None:
+                results.put_nowait(await self._analyze_batch(batch, limiter))
+
+        workers = asyncio.gather(
+            asyncio.to_thread(produce),
+            *(consume() for _ in range(self.max_concurrent_limit)),
+        )
+        workers.add_done_callback(lambda _: results.put_nowait(None))
+        try:
+            while (res := await results.get()) is not None:
+                yield res
+            await workers  # Surfaces errors from preparing the report
+        finally:
+            workers.cancel()
 
-                return {"chunk_index": index, "result": res}
-            except KeyboardInterrupt as e:
-                logger.error("Process interrupted by user.")
-                raise e
-            except Exception as e:
-                logger.error(f"Errpr processing chunk {index}: {str(e)}")
-                return {"chunk_index": index, "error": str(e)}
+    async def _process_report_batch_api(self, tmp_file_path: str) -> AsyncIterator[Dict]:
+        """
+        Analyzes the chunks not found in the cache with a single Batch API job, falling
+        back to concurrent requests if the job fails.
+
+        Args:
+            tmp_file_path (str): Path to the temporary file containing the report.
+
+        Yields:
+            Dict: The result of each analyzed batch.
+        """
+        chunks = await asyncio.to_thread(
+            lambda: self._deduplicate_chunks(
+                list(enumerate(self._prepare_chunks(tmp_file_path)))
+            )
+        )
+
+        pending = []  # (batch, texts hash) of the batches to analyze
+        for start in range(0, len(chunks), self.chunks_per_request):
+            batch = chunks[start : start + self.chunks_per_request]
+            texts_hash = self._get_texts_hash(batch)
+            res = await asyncio.to_thread(self._get_cached_chunk_results, texts_hash)
+            if res is not None:
+                yield {"chunk_index": batch[0][0], "result": res}
+            else:
+                pending.append((batch, texts_hash))
+        if not pending:
+            return
+
+        logger.info(f"Submitting {len(pending)} requests as a Batch API job...")
+        try:
+            results = await self.report_analyze_agent.analyze_chunks_batch(
+                [self._get_batch_texts(batch) for batch, _ in pending]
+            )
+        except Exception as e:
+            logger.warning(f"Batch API job failed, sending the requests one by one: {e}")
+            # Tasks are created only up to the concurrency bound, the next when one ends
+            limiter = AdaptiveLimiter(self.max_concurrent, self.max_concurrent_limit)
+            batches = iter(batch for batch, _ in pending)
+            in_flight = set()
+            while True:
+                for batch in batches:
+                    in_flight.add(asyncio.create_task(self._analyze_batch(batch, limiter)))
+                    if len(in_flight) >= self.max_concurrent_limit:
+                        break
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+
+        for (batch, texts_hash), res in zip(pending, results):
+            if res is None:
+                yield {"chunk_index": batch[0][0], "error": "Batch API request failed."}
+                continue
+            await asyncio.to_thread(self._cache_chunk_results, texts_hash, res)
+            yield {"chunk_index": batch[0][0], "result": res}
+
+    def _get_batch_texts(self, batch: List[Tuple[int, object]]) -> List[Tuple[int, str]]:
+        """
+        Returns the texts to analyze of a batch of chunks.
+
+        The overlap a chunk repeats from the previous chunk is sent only once when both
+        are in the same request.
+
+        Args:
+            batch (List[Tuple[int, object]]): The index and chunk of each chunk.
+
+        Returns:
+            List[Tuple[int, str]]: The index and text of each chunk.
+        """
+        texts = []
+        for i, (index, chunk) in enumerate(batch):
+            text = chunk.text
+            if i and batch[i - 1][0] == index - 1:
+                text = _strip_overlap(batch[i - 1][1].text, text, self.overlap)
+            texts.append((index, text))
+        return texts
+
+    def _get_texts_hash(self, batch: List[Tuple[int, object]]) -> str:
+        """
+        Computes the cache key of a batch of chunks from their texts, the cache schema
+        version and the analyze agent's model and prompts.
+
+        Args:
+            batch (List[Tuple[int, object]]): The index and chunk of each chunk.
+
+        Returns:
+            str: The SHA-256 hex digest of the key.
+        """
+        return hashlib.sha256(
+            "\0".join(
+                (
+                    CACHE_SCHEMA_VERSION,
+                    self.report_analyze_agent.fingerprint,
+                    *(chunk.text for _, chunk in batch),
+                )
+            ).encode()
+        ).hexdigest()
+
+    async def _analyze_batch(
+        self, batch: List[Tuple[int, object]], limiter: AdaptiveLimiter
+    ) -> Dict:
+        """
+        Analyzes a batch of consecutive chunks in one request.
+
+        Args:
+            batch (List[Tuple[int, object]]): The index and chunk of each chunk to analyze.
+            limiter (AdaptiveLimiter): Limits the requests in flight, shrunk on 429 and 5xx errors.
+
+        Returns:
+            Dict: The result of the analysis or error information, under the first chunk index.
+        """
+        indexes = ", ".join(str(index) for index, _ in batch)
+        # Chunks analyzed by an interrupted or earlier run are not sent again
+        texts_hash = self._get_texts_hash(batch)
+        res = await asyncio.to_thread(self._get_cached_chunk_results, texts_hash)
+        if res is not None:
+            logger.info(f"Using cached results for chunks {indexes}.")
+            return {"chunk_index": batch[0][0], "result": res}
+
+        await limiter.acquire()
+        overloaded = False
+        try:
+            res = await self.report_analyze_agent.analyze_chunks_async(
+                self._get_batch_texts(batch)
+            )
+            print(f"""\n{'***'} Chunks:{indexes} {'***'}\n{res}""")
+
+            await asyncio.to_thread(self._cache_chunk_results, texts_hash, res)
+            return {"chunk_index": batch[0][0], "result": res}
+        except Exception as e:
+            # Errors become results here, so gathering the consumers never sees them;
+            # KeyboardInterrupt is not an Exception and still stops the workflow
+            overloaded = _is_overloaded_error(e)
+            if overloaded:
+                logger.warning(
+                    f"Provider overloaded, lowering concurrency to {max(1, limiter.limit // 2)}."
+                )
+            logger.error(f"Errpr processing chunks {indexes}: {str(e)}")
+            return {"chunk_index": batch[0][0], "error": str(e)}
+        finally:
+            await limiter.release(overloaded)
+
+    def _get_cached_chunk_results(self, texts_hash: str) -> Optional[ReportResults]:
+        """
+        Returns the cached analysis of a batch of chunks.
+
+        Args:
+            texts_hash (str): The SHA-256 of the chunk texts.
+
+        Returns:
+            Optional[ReportResults]: The cached results, or None on a miss.
+        """
+        try:
+            with open(os.path.join(CHUNK_CACHE_DIR, f"{texts_hash}.json"), "rb") as f:
+                return ReportResults.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _cache_chunk_results(self, texts_hash: str, results: ReportResults) -> None:
+        """
+        Stores the analysis of a batch of chunks.
+
+        Args:
+            texts_hash (str): The SHA-256 of the chunk texts.
+            results (ReportResults): The results to cache.
+        """
+        try:
+            os.makedirs(CHUNK_CACHE_DIR, exist_ok=True)
+            with open(os.path.join(CHUNK_CACHE_DIR, f"{texts_hash}.json"), "wb") as f:
+                f.write(to_json(results))
+        except OSError as e:
+            logger.warning(f"Unable to cache chunk results: {e}")
 
     def _get_node_comparison_string(self, node: Dict) -> str:
         """
@@ -573,59 +1414,71 @@ class InsidersWorkflow(Workflow):
         props = node.get("properties", {}) or {}
         label = (node.get("label", "")).lower() or ""
 
-        if label in ["person", "company", "committee", "auditor"]:
-            return self._normalize_str(props.get("name", ""))
-        elif label == "board":
-            return self._normalize_str(props.get("type", ""))
-        else:
-            # Generic fallback
-            return self._normalize_str(" ".join(map(str, props.values())))
-
-    def _find_match(self, new_node: Dict, existing_nodes: List[Dict]) -> Optional[str]:
+        keys = _COMPARISON_KEYS.get(label)
+        if keys is None:
+            # Generic fallback on the text values, URLs such as the source excluded
+            keys = [k for k, v in props.items() if isinstance(v, str) and k != "source"]
+        return self._normalize_str(" ".join(str(props.get(k) or "") for k in keys))
+
+    def _find_match(
+        self,
+        new_node: Dict,
+        new_norm: str,
+        candidates: Dict[str, Tuple[str, str, str]],
+    ) -> Optional[str]:
         """
         Finds the best match for a new node among existing ones using fuzzy matching on IDs.
 
+        Exact comparison string matches are resolved by the caller's hash index first.
+
         Args:
-            node_id (Dict): The new node to match.
-            existing_nodes (List[Dict]): Existing nodes to compare against.
+            new_node (Dict): The new node to match.
+            new_norm (str): The comparison string of the new node.
+            candidates (Dict[str, Tuple[str, str, str]]): Existing nodes with the same label,
+                as ID -> (ID sort key, comparison string, processed comparison string),
+                computed once per node.
 
         Returns:
             Optional[str]: The ID of the existing node if similarity score above threshold, else None.
         """
-        best_match_id = None
-        best_score = 0
+        if not candidates:
+            return None
 
         new_id = new_node.get("id", "") or ""
-        new_label = new_node.get("label", "") or ""
-        new_norm = self._get_node_comparison_string(new_node) or ""
-        new_id_norm = self._normalize_str(new_id)
-
-        # Compare only with nodes of the same type (label)
-        for existing_id, existing_node in existing_nodes.items():
-            if (existing_node.get("label", "") or "") != new_label:
-                continue
-
-            existing_norm = self._get_node_comparison_string(existing_node)
-            existing_id_norm = self._normalize_str(existing_id)
-
-            if existing_norm and new_norm and new_norm == existing_norm:
-                return existing_id
-
-            id_score = fuzz.token_sort_ratio(new_id_norm, existing_id_norm)
-            norm_score = (
-                fuzz.token_set_ratio(new_norm, existing_norm)
-                if existing_norm and new_norm
-                else 0
-            )
-
-            combined = int(0.7 * id_score + 0.3 * norm_score)
+        new_id_key = _get_sort_key(self._normalize_str(new_id))
+
+        candidate_ids = list(candidates)
+        candidate_id_keys = [id_key for id_key, _, _ in candidates.values()]
+        candidate_norm_keys = [norm_key for _, _, norm_key in candidates.values()]
+
+        # Score all the candidates in one vectorized call per scorer. Even with a
+        # perfect comparison string, an ID scoring below MIN_ID_SCORE cannot reach
+        # MATCH_THRESHOLD, so the scorer is cut off there and those are skipped
+        # The keys are processed once per node: ratio on sorted tokens is token_sort_ratio
+        id_scores = process.cdist(
+            [new_id_key],
+            candidate_id_keys,
+            scorer=ratio,
+            score_cutoff=MIN_ID_SCORE - 0.5,
+        )[0].round()
+        reachable = np.flatnonzero(id_scores >= MIN_ID_SCORE)
+        if not reachable.size:
+            return None
+
+        if new_norm:
+            norm_scores = process.cdist(
+                [utils.default_process(new_norm)],
+                [candidate_norm_keys[i] for i in reachable],
+                scorer=token_set_ratio,
+            )[0].round()
+        else:
+            norm_scores = 0
 
-            if combined > best_score:
-                best_score = combined
-                best_match_id = existing_id
+        combined = (0.7 * id_scores[reachable] + 0.3 * norm_scores).astype(int)
+        best = int(combined.argmax())  # First of the best, as in a strict > scan
 
-        if best_score >= 80:
-            return best_match_id
+        if combined[best] >= MATCH_THRESHOLD:
+            return candidate_ids[reachable[best]]
 
         return None
 
@@ -645,18 +1498,37 @@ class InsidersWorkflow(Workflow):
 
         for key, value in new_props.items():
             # Update only if the new value is not None or empty
-            if value is not None and value != "":
-                if key not in old_props or old_props[key] == "":
-                    old_props[key] = value
-                elif value == old_props[key]:
-                    continue
-                elif isinstance(value, str) and isinstance(old_props.get(key), str):
-                    # Keep the longer string, assuming it's more complete
-                    if len(value) > len(old_props[key]):
-                        old_props[key] = value
-                else:
-                    # Default to replacing the old value
+            if value is None or value == "":
+                continue
+            old_value = old_props.get(key, "")  # Missing keys read as empty
+            if old_value == "":
+                old_props[key] = value
+            elif value == old_value:
+                continue
+            elif isinstance(value, str) and isinstance(old_value, str):
+                # Keep the longer string, assuming it's more complete
+                if len(value) > len(old_value):
                     old_props[key] = value
+            else:
+                # Default to replacing the old value
+                old_props[key] = value
+
+    def _update_edge_properties(self, old: Dict, new: Dict, owned_edges: set) -> None:
+        """
+        Updates the properties of a kept edge, copying them first if still shared with a chunk result.
+
+        Args:
+            old (Dict): kept edge.
+            new (Dict): new edge.
+            owned_edges (set): id() of the edges whose properties dict was already copied.
+
+        Returns:
+            None
+        """
+        if id(old) not in owned_edges:
+            old["properties"] = dict(old["properties"])
+            owned_edges.add(id(old))
+        self._update_properties(old, new)
 
     def _collect_chunks_results(self, chunks_results: List[Dict]) -> Dict:
         """
@@ -668,102 +1540,238 @@ class InsidersWorkflow(Workflow):
         Returns:
             Dict: Potentially merged results containing unique nodes and edges.
         """
-        final_nodes = {}
-        final_edges = {}
-        id_map = {}  # Maps matched IDs to final IDs
-
+        state = self._new_merge_state()
         for res in chunks_results:
-            result_data = res.get("result")  # ReportResults object
-            if not result_data:
-                continue
+            self._merge_single_result(res, state)
+        return self._get_merged_results(state)
 
-            for node in result_data.nodes:
-                node_dict = {
-                    "id": node.id,
-                    "label": node.label,
-                    "properties": node.properties.copy(),
-                }
-                match_id = self._find_match(node_dict, final_nodes)
-                if match_id:
-                    self._update_properties(
-                        final_nodes[match_id],
-                        node_dict,
-                    )
-                    canonical = match_id
-                    logger.info(f"Merging node {node.id} -> {canonical}")
-                else:
-                    canonical = node.id
-                    final_nodes[canonical] = node_dict
-                    logger.info(f"Adding new node {canonical}")
-
-                # Keep track of ID mapping for edges analysis
-                id_map[node.id] = canonical
-
-            for edge in result_data.edges:
-                src = id_map.get(edge.source, edge.source)
-                dst = id_map.get(edge.dest, edge.dest)
-                edge_key = f"{src}_{edge.type}_{dst}"
-                edge_obj = {
-                    "source": src,
-                    "type": edge.type,
-                    "dest": dst,
-                    "properties": edge.properties.copy(),
-                }
+    def _new_merge_state(self) -> Dict:
+        """
+        Creates the empty state that chunk results are merged into.
 
-                if edge_key in final_edges:
-                    existing = final_edges[edge_key]
-                    
-                    # Skip exact duplicates
-                    if edge_obj["properties"] == existing["properties"]:
-                        logger.info(f"Duplicate exact edge {edge_key}, skipping.")
-                        continue
-                    
-                    if edge_obj["properties"] == {}:
-                        logger.info(
-                            f"Duplicate empty edge properties for {edge_key}, skipping."
-                        )
-                        continue
-                    if existing["properties"] == {}:
-                        final_edges[edge_key] = edge_obj
-                        logger.info(f"Updated empty edge properties for {edge_key}.")
-                        continue
-
-                    temp = set(edge_obj["properties"].keys()).intersection(
-                        set(existing["properties"].keys())
-                    )
-                    temp.discard("from")
-                    temp.discard("to")
-                    
-                    # If no overlapping properties, merge
-                    if not temp or len(temp) == 0:
-                        logger.info(
-                            f"Duplicate edge with no overlapping properties for {edge_key}, merging."
-                        )
-                        self._update_properties(existing, edge_obj)
-                        continue
+        Returns:
+            Dict: The merge state, to pass to `_merge_single_result`.
+        """
+        return {
+            "final_nodes": {},
+            # Distinct edges for each (source, type, dest)
+            "final_edges": {},
+            # Properties signature of each distinct edge, aligned with final_edges
+            "edge_signatures": {},
+            "owned_edges": set(),  # id() of the edges whose properties dict was already copied
+            "deferred_edges": [],  # Edges referencing IDs not mapped yet
+            "id_map": {},  # Maps matched IDs to final IDs
+            "owned_properties": set(),  # Final nodes whose properties dict was already copied
+            # Label -> node ID -> (ID sort key, comparison string, processed comparison
+            # string) of the final nodes
+            "match_index": {},
+            "exact_index": {},  # (label, comparison string) -> ID
+        }
 
-                    # If overlapping properties, check similarity
-                    if self._has_similar_properties(
-                        edge_obj["properties"], existing["properties"]
-                    ):
-                        self._update_properties(existing, edge_obj)
-                        logger.info(f"Updated edge properties for {edge_key}")
-                    else:
-                        suffix = 1
-                        new_key = f"{edge_key}_{suffix}"
-                        while new_key in final_edges:
-                            suffix += 1
-                            new_key = f"{edge_key}_{suffix}"
-                        final_edges[new_key] = edge_obj
-                        logger.info(f"Keeping distinct edge as {new_key}")
-                else:
-                    final_edges[edge_key] = edge_obj
+    def _get_merged_results(self, state: Dict) -> Dict:
+        """
+        Returns the nodes and edges merged so far, after merging the deferred edges.
 
+        Args:
+            state (Dict): The merge state.
+
+        Returns:
+            Dict: Potentially merged results containing unique nodes and edges.
+        """
+        deferred_edges, state["deferred_edges"] = state["deferred_edges"], []
+        for edge in deferred_edges:
+            self._merge_edge(edge, state)
         return {
-            "nodes": list(final_nodes.values()),
-            "edges": list(final_edges.values()),
+            "nodes": list(state["final_nodes"].values()),
+            "edges": [
+                edge for variants in state["final_edges"].values() for edge in variants
+            ],
+        }
+
+    def _merge_single_result(self, res: Dict, state: Dict) -> None:
+        """
+        Merges the result of one chunk into the state using fuzzy matching on node IDs.
+
+        Args:
+            res (Dict): The result of a chunk.
+            state (Dict): The merge state, updated in place.
+        """
+        final_nodes: Dict[str, Dict] = state["final_nodes"]
+        id_map: Dict[str, str] = state["id_map"]
+        owned_properties: set = state["owned_properties"]
+        match_index: Dict[str, Dict[str, Tuple[str, str, str]]] = state["match_index"]
+        exact_index: Dict[Tuple[str, str], str] = state["exact_index"]
+
+        result_data = res.get("result")  # ReportResults object
+        if not result_data:
+            return
+
+        # Merge decisions are logged with deferred formatting, skipped when INFO is off
+        for node in result_data.nodes:
+            node_dict = {
+                "id": node.id,
+                "label": node.label,
+                "properties": node.properties,  # Copied only if merged into
+            }
+            # Compare only with nodes of the same type (label)
+            label = node.label or ""
+            candidates = match_index.setdefault(label, {})
+            new_norm = self._get_node_comparison_string(node_dict) or ""
+            # IDs and names repeated verbatim across chunks resolve in O(1)
+            if node.id in candidates:
+                match_id = node.id
+            else:
+                match_id = exact_index.get((label, new_norm)) if new_norm else None
+            if match_id is None:
+                match_id = self._find_match(node_dict, new_norm, candidates)
+            if match_id:
+                if match_id not in owned_properties:
+                    final_nodes[match_id]["properties"] = dict(
+                        final_nodes[match_id]["properties"]
+                    )
+                    owned_properties.add(match_id)
+                self._update_properties(
+                    final_nodes[match_id],
+                    node_dict,
+                )
+                # The merged properties may carry a more complete name
+                old_norm = candidates[match_id][1]
+                merged_norm = self._get_node_comparison_string(final_nodes[match_id])
+                if merged_norm != old_norm:
+                    candidates[match_id] = (
+                        candidates[match_id][0],
+                        merged_norm,
+                        utils.default_process(merged_norm),
+                    )
+                    if exact_index.get((label, old_norm)) == match_id:
+                        del exact_index[(label, old_norm)]
+                    if merged_norm:
+                        exact_index.setdefault((label, merged_norm), match_id)
+                canonical = match_id
+                logger.info("Merging node %s -> %s", node.id, canonical)
+            else:
+                canonical = sys.intern(node.id)
+                final_nodes[canonical] = node_dict
+                candidates[canonical] = (
+                    _get_sort_key(self._normalize_str(canonical)),
+                    new_norm,
+                    utils.default_process(new_norm),
+                )
+                if new_norm:
+                    exact_index.setdefault((label, new_norm), canonical)
+                logger.info("Adding new node %s", canonical)
+
+            # Keep track of ID mapping for edges analysis; the final IDs are interned
+            # so edge keys built from them share the same string objects
+            id_map[node.id] = sys.intern(canonical)
+
+        for edge in result_data.edges:
+            # Edges to nodes of later chunks are merged once all the IDs are mapped
+            if edge.source in id_map and edge.dest in id_map:
+                self._merge_edge(edge, state)
+            else:
+                state["deferred_edges"].append(edge)
+
+    def _merge_edge(self, edge, state: Dict) -> None:
+        """
+        Merges an edge into the state, with its source and destination mapped to the final node IDs.
+
+        Args:
+            edge (Edge): The edge of a chunk.
+            state (Dict): The merge state, updated in place.
+        """
+        final_edges: Dict[Tuple, List[Dict]] = state["final_edges"]
+        edge_signatures: Dict[Tuple, List[Tuple]] = state["edge_signatures"]
+        owned_edges: set = state["owned_edges"]
+        id_map: Dict[str, str] = state["id_map"]
+
+        src = id_map.get(edge.source, edge.source)
+        dst = id_map.get(edge.dest, edge.dest)
+        edge_type = sys.intern(edge.type)
+        edge_key = (src, edge_type, dst)
+        edge_obj = {
+            "source": src,
+            "type": edge_type,
+            "dest": dst,
+            "properties": edge.properties,  # Copied only if merged into
         }
-    
+
+        variants = final_edges.get(edge_key)
+        signature = _get_properties_signature(edge_obj["properties"])
+        if variants is None:
+            final_edges[edge_key] = [edge_obj]
+            edge_signatures[edge_key] = [signature]
+            return
+
+        if edge_obj["properties"] == {}:
+            logger.info(
+                "Duplicate empty edge properties for %s, skipping.", edge_key
+            )
+            return
+
+        fingerprint, keys = signature
+        signatures = edge_signatures[edge_key]
+        # Compare with every distinct edge already kept for the same key: the first
+        # variant that is a duplicate, empty, disjoint or similar takes the edge
+        match, match_reason = None, None
+        overlapping = []  # Variants before the match that need a similarity check
+        for i, existing in enumerate(variants):
+            existing_fingerprint, existing_keys = signatures[i]
+            # Skip exact duplicates, different fingerprints are never equal
+            if (
+                fingerprint is None
+                or existing_fingerprint is None
+                or fingerprint == existing_fingerprint
+            ) and edge_obj["properties"] == existing["properties"]:
+                match, match_reason = i, "exact"
+                break
+            if not existing["properties"]:
+                match, match_reason = i, "empty"
+                break
+            # If no overlapping properties, merge
+            if not keys & existing_keys:
+                match, match_reason = i, "disjoint"
+                break
+            overlapping.append(i)
+
+        # If overlapping properties, check similarity of all of them at once
+        if overlapping:
+            similar = self._find_similar_properties(
+                edge_obj["properties"],
+                [variants[i]["properties"] for i in overlapping],
+            )
+            for i, is_similar in zip(overlapping, similar):
+                if is_similar:
+                    match, match_reason = i, "similar"
+                    break
+
+        if match is not None:
+            existing = variants[match]
+            if match_reason == "exact":
+                logger.info("Duplicate exact edge %s, skipping.", edge_key)
+            elif match_reason == "empty":
+                existing["properties"] = edge_obj["properties"]
+                owned_edges.discard(id(existing))
+                signatures[match] = signature
+                logger.info("Updated empty edge properties for %s.", edge_key)
+            elif match_reason == "disjoint":
+                logger.info(
+                    "Duplicate edge with no overlapping properties for %s, merging.",
+                    edge_key,
+                )
+                self._update_edge_properties(existing, edge_obj, owned_edges)
+                signatures[match] = _get_properties_signature(existing["properties"])
+            else:
+                self._update_edge_properties(existing, edge_obj, owned_edges)
+                signatures[match] = _get_properties_signature(existing["properties"])
+                logger.info("Updated edge properties for %s", edge_key)
+        else:
+            variants.append(edge_obj)
+            signatures.append(signature)
+            logger.info(
+                "Keeping distinct edge %s (%d variants)", edge_key, len(variants)
+            )
+
     def _normalize_str(self, v: Optional[str]) -> str:
         """
         Normalizza una stringa per il confronto:
@@ -773,12 +1781,7 @@ class InsidersWorkflow(Workflow):
         """
         if v is None:
             return ""
-        s = str(v).strip().lower()
-        # rimuovi punteggiatura comune mantenendo lettere/numeri/spazi
-        s = re.sub(r"[^\w\s]", " ", s, flags=re.UNICODE)
-        # collassa più spazi in uno
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return _normalize_text(str(v))
 
     def _has_similar_properties(self, props1: Dict, props2: Dict) -> bool:
         """
@@ -791,44 +1794,63 @@ class InsidersWorkflow(Workflow):
         Returns:
             bool: True if properties are similar, False otherwise.
         """
-        if not props1 or not props2:
-            return False
+        return self._find_similar_properties(props1, [props2])[0]
 
-        # Consider only keys present in either (but require overlap)
-        common_keys = set(props1.keys()).intersection(set(props2.keys()))
-        # Ignore date fields for similarity
-        common_keys.discard("from")
-        common_keys.discard("to")
-        if not common_keys or len(common_keys) == 0:
-            return False
-
-        match_count = 0
-        for key in common_keys:
-            v1 = props1.get(key)
-            v2 = props2.get(key)
-            if v1 is None or v2 is None:
-                continue
+    def _find_similar_properties(self, props: Dict, others: List[Dict]) -> List[bool]:
+        """
+        Checks which of several sets of properties are similar enough to the given one
+        to consider the edges as duplicates, scoring all the fuzzy pairs in a single call.
 
-            s1 = self._normalize_str(v1)
-            s2 = self._normalize_str(v2)
-            if s1 == s2:
-                match_count += 1
-                continue
+        Args:
+            props (Dict): The set of properties to compare.
+            others (List[Dict]): The sets of properties to compare it with.
 
-            s1_clean = s1.replace("independent", "").replace("non-executive", "").replace("executive", "").replace("non-independent", "")
-            s2_clean = s2.replace("independent", "").replace("non-executive", "").replace("executive", "").replace("non-independent", "")
-            if s1_clean == s2_clean:
-                match_count += 1
+        Returns:
+            List[bool]: For each set in others, True if its properties are similar.
+        """
+        if not props:
+            return [False] * len(others)
+
+        match_counts = np.zeros(len(others))
+        key_counts = np.zeros(len(others))
+        fuzzy_pairs = []  # Values compared with a single batched scorer call below
+        fuzzy_owners = []  # Index in others of each fuzzy pair
+        for i, other in enumerate(others):
+            if not other:
                 continue
 
-            score = fuzz.token_set_ratio(s1, s2)
-            if score >= 70:
-                match_count += 1
+            # Consider only keys present in both, ignoring date fields for similarity
+            common_keys = props.keys() & other.keys() - _EDGE_DATE_KEYS
+            key_counts[i] = len(common_keys)
+
+            pairs = [
+                (self._normalize_str(props[key]), self._normalize_str(other[key]))
+                for key in common_keys
+                if props[key] is not None and other[key] is not None
+            ]
+            outcomes = [_compare_values(s1, s2) for s1, s2 in pairs]
+            match_counts[i] = outcomes.count(True)
+            for pair, outcome in zip(pairs, outcomes):
+                if outcome is None:
+                    fuzzy_pairs.append(pair)
+                    fuzzy_owners.append(i)
+
+        if fuzzy_pairs:
+            scores = process.cpdist(
+                [s1 for s1, _ in fuzzy_pairs],
+                [s2 for _, s2 in fuzzy_pairs],
+                scorer=token_set_ratio,
+                processor=utils.default_process,
+                score_cutoff=69.5,  # Rounds up to 70, the scorer gives up earlier below
+            )
+            match_counts += np.bincount(
+                fuzzy_owners, weights=scores.round() >= 70, minlength=len(others)
+            )
 
-        similarity_ratio = match_count / len(common_keys)
-        return similarity_ratio >= 0.5
+        # match_count / key_count >= 0.5, for the sets with at least one common key
+        return ((key_counts > 0) & (2 * match_counts >= key_counts)).tolist()
 
-    def _validate_results(self, results: Dict) -> ReportResults:
+    async def _validate_results(self, results: Dict) -> ReportResults:
         """
         Validates and cleans the final results using the ValidationAgent.
 
@@ -838,15 +1860,18 @@ class InsidersWorkflow(Workflow):
         Returns:
             ReportResults: The validated and cleaned results.
         """
-        retries = 3
-        for attempt in range(retries):
+        for attempt in range(AGENT_RETRIES):
             try:
-                validated_results = self.validation_agent.validate_results(results)
+                validated_results = await self.validation_agent.validate_results_async(
+                    results
+                )
                 return validated_results
-            except Exception as e:
-                if attempt < retries - 1:
+            except AgentException as e:
+                # Only agent failures are retried, programming errors fail fast
+                if attempt < AGENT_RETRIES - 1:
                     message = f"Error validating final results (attempt {attempt + 1}): {str(e)}. Retrying..."
                     logger.warning(message)
+                    await asyncio.sleep(min(2**attempt + random.random(), RETRY_MAX_DELAY))
                 else:
                     message = "Max retries reached. Unable to validate final results."
                     raise WorkflowException(message) from e
@@ -862,15 +1887,11 @@ class InsidersWorkflow(Workflow):
         Returns:
             None
         """
-        source_property = {"source": source_url}
-
         for node in results.nodes:
-            if "source" not in node.properties:
-                node.properties.update(source_property)
+            node.properties.setdefault("source", source_url)
 
         for edge in results.edges:
-            if "source" not in edge.properties:
-                edge.properties.update(source_property)
+            edge.properties.setdefault("source", source_url)
 
 
 ############ Unused ###############
@@ -896,7 +1917,14 @@ def _find_best_match(
             existing_node_str = self._get_node_comparison_string(existing_node)
 
             # Usiamo token_sort_ratio che è robusto all'ordine delle parole
-            score = fuzz.token_sort_ratio(new_node_str, existing_node_str)
+            score = round(
+                token_sort_ratio(
+                    new_node_str,
+                    existing_node_str,
+                    processor=utils.default_process,
+                    score_cutoff=self.similarity_threshold,
+                )
+            )
 
             if score > best_score:
                 best_score = score
@@ -912,49 +1940,46 @@ def _find_best_match(
         if not result_data:
             continue
 
-        for edge in result_data.edges:
-            # Traduci source e dest usando la mappa degli ID
-            source_id = id_map.get(edge.source)
-            dest_id = id_map.get(edge.dest)
-
-            # Se un ID non è nella mappa (es. da un nodo scartato), salta l'arco
-            if not source_id or not dest_id:
-                continue
-
-            # Crea una chiave unica per l'arco per gestire i duplicati
-            edge_key = (source_id, edge.type, dest_id)
+        # Traduci source e dest usando la mappa degli ID; se un ID non è nella mappa
+        # (es. da un nodo scartato), salta l'arco
+        edges = [
+            ((id_map.get(edge.source), edge.type, id_map.get(edge.dest)), edge)
+            for edge in result_data.edges
+        ]
+        edges = [(edge_key, edge) for edge_key, edge in edges if edge_key[0] and edge_key[2]]
 
-            if edge_key in final_result["edges"] or (
-                edge_key == "HOLDS_POSITION"
-                and self._has_similar_properties(
-                    edge.properties, final_result["edges"][edge_key]["properties"]
-                )
-            ):
+        for edge_key, edge in edges:
+            existing = final_result["edges"].get(edge_key)
+            if existing is not None:
                 logger.info(f"Duplicate edge detected: {edge_key}, merging properties.")
-                # Arco già esistente, aggiorna le proprietà
-                self._update_properties(
-                    edge.properties, final_result["edges"][edge_key]["properties"]
-                )
-            else:
-                # Nuovo arco, aggiungilo con gli ID corretti
-                final_result["edges"][edge_key] = {
-                    "source": source_id,
+                # Arco già esistente, aggiorna le proprietà (copiate solo ora)
+                existing["properties"] = dict(existing["properties"])
+                self._update_properties(existing, {"properties": edge.properties})
+
+        # Nuovi archi, aggiunti in blocco con gli ID corretti
+        final_result["edges"].update(
+            {
+                edge_key: {
+                    "source": edge_key[0],
                     "type": edge.type,
-                    "dest": dest_id,
-                    "properties": edge.properties.copy(),
+                    "dest": edge_key[2],
+                    "properties": edge.properties,
                 }
-
+                for edge_key, edge in edges
+                if edge_key not in final_result["edges"]
+            }
+        )
 
 def _summarize_results(self, chunks_results: List[str]) -> ReportResults:
-    retries = 3
-    for attempt in range(retries):
+    for attempt in range(AGENT_RETRIES):
         try:
             res = self.summarization_agent.summarize_results(chunks_results)
             return res
-        except Exception as e:
-            if attempt < retries - 1:
+        except AgentException as e:
+            if attempt < AGENT_RETRIES - 1:
                 message = f"Error summarizing results (attempt {attempt + 1}): {str(e)}. Retrying..."
                 logger.warning(message)
+                time.sleep(min(2**attempt + random.random(), RETRY_MAX_DELAY))
             else:
                 message = "Max retries reached. Unable to summarize results."
                 raise WorkflowException(message) from e
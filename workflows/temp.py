@@ -1,6 +1,11 @@
-from textwrap import dedent
-from typing import Iterator, List, Optional
-from pydantic import BaseModel, Field
+import asyncio
+from datetime import datetime, timezone
+import hashlib
+import os
+import sys
+from typing import AsyncIterator, Dict, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 
 from agno.agent import Agent, RunResponse
 from agno.workflow import Workflow
@@ -9,11 +14,32 @@ from agno.tools.googlesearch import GoogleSearchTools
 from agno.tools.reasoning import ReasoningTools
 from agno.utils.pprint import pprint_run_response
 from agno.utils.log import log_debug, log_warning
+from google.genai.types import Content, InlinedRequest, Part
 
+from agents.report_analyze_agent import wait_for_batch_job
+from tools._http import aclose_async_client, get_async_client
+from prompts.temp_workflow_prompt import (
+    REPORT_AGENT_CONTEXT,
+    REPORT_AGENT_DESCRIPTION,
+    REPORT_AGENT_INSTRUCTIONS,
+    SEARCH_AGENT_CONTEXT,
+    SEARCH_AGENT_DESCRIPTION,
+    SEARCH_AGENT_INSTRUCTIONS,
+)
 from tools.crawl import CrawlTools
 from tools.pdf import PDFTools
 
 
+# Companies processed at the same time by TempWorkflow.arun
+MAX_INFLIGHT_COMPANIES = 16
+
+# Report URLs found by the search agent, cached per company and month
+REPORT_URL_CACHE_DIR = os.path.join(".insiders_cache", "report_urls")
+
+# Report texts, cached per URL and HTTP validators (Content-Length, ETag, Last-Modified)
+REPORT_TEXT_CACHE_DIR = os.path.join(".insiders_cache", "report_texts")
+
+
 # This model will be used to structure the output of the search agent
 class Report(BaseModel):
     url: Optional[str] = Field(
@@ -53,49 +79,27 @@ class Insider(BaseModel):
     )
 
 
+# Validates the report agent output, a list of insiders
+_INSIDERS_ADAPTER = TypeAdapter(List[Insider])
+
+
 class TempWorkflow(Workflow):
     """This workflow is designed to find the latest corporate governance report of a specified company. Analyze the report and extract relevant information about the governance of the company."""
 
     # An agent designed to search for corporate governance reports
     search_agent = Agent(
-        model=Gemini(id="gemini-2.5-flash", temperature=0.1, top_p=0.95),
+        # Only orchestrates the tools to find a URL, the lighter model is enough
+        model=Gemini(id="gemini-2.5-flash-lite", temperature=0.0, top_p=1.0),
         tools=[
             GoogleSearchTools(fixed_max_results=5, cache_results=True),
-            CrawlTools(max_length=25000, cache_results=True),
-            ReasoningTools(add_instructions=True),
+            # Non-HTML links are skipped after a HEAD request, without loading them in the browser
+            CrawlTools(max_length=25000, cache_results=True, probe_content_type=True),
         ],
-        description=dedent(
-            """
-            You are part of a workflow that is designed to analyze and extract information about the governance structure of companies and key personnel, and synthesize those informations into a knowledge graph.
-            You are the first step of the workflow, and your task is to find the URL of the latest corporate governance report of the company specified by the user.
-            """
-        ),
-        context=[
-            "Corporate governance reports are typically found on the official website of the company, often under sections like 'Investor Relations' or 'Corporate Governance'.",
-            "The report may be in PDF format or available as a webpage.",
-            "Companies usually publish corporate governance reports annually on their websites and provide a list of past reports as well, you have to check the year of the reports available and return the latest one.",
-            "The user is interested in italian companies reports, notice that the website may be in italian language, and the report name may be in italian as well",
-        ],
-        instructions=dedent(
-            """
-            Follow these instructions carefully:
-            
-            1. 🌐 Use 'google_search' tool to search for the corporate governance section of the company's website. Example query: "[company_name] governance".
-            2. 🔍 Select the most relevant page and use the 'crawl' tool to extract the content of that page. Analyze the content and search for a reference to the latest corporate governance report within the crawled content.
-            3. If the report is found, extract the URL and return it in the format: '{"url": "http://example.com/report.pdf"}'.
-            4. If no report is found, analyze the crawled content to determine if there are any linked pages that might contain the report. Follow the links and crawl those pages as well to find the report.
-            5. If no report can be found, return an empty URL: '{"url": null}'.
-
-            ## Considerations:
-            - Ensure the URL is complete and is the one of the latest corportate governance report (if available).
-            - You should use few tool calls and avoid unnecessary ones, you have only to find the URL of the latest corporate governance report, do not try to extract the content of the report or analyze it, because it is done in the next step of the workflow.
-            - If the governance report is not available, but the financial report is available, you can return the URL of the latest financial report available as well.
-            - Skip any document that is has not a corporate governance report, or financial report, even if it is in governance section of the website.
-            - Sometimes companies may not publish reports online, but they list the board members and other executives directicly on their website pages. I will crawl those pages in the next step of the workflow if no report is found.
-            """
-        ),
+        description=SEARCH_AGENT_DESCRIPTION,
+        context=SEARCH_AGENT_CONTEXT,
+        instructions=SEARCH_AGENT_INSTRUCTIONS,
         show_tool_calls=True,
-        tool_call_limit=15,
+        tool_call_limit=8,  # A search, a batch of up to 3 crawls and a few followed links
         use_json_mode=True,
         response_model=Report,
         debug_mode=True,
@@ -104,65 +108,15 @@ class TempWorkflow(Workflow):
         add_datetime_to_instructions=True,
     )
 
+    # Extracts the reports for the report agent, or before running it when possible
+    pdf_tools = PDFTools()
+
     report_agent = Agent(
         model=Gemini(id="gemini-2.5-flash", temperature=0.1, top_p=0.95),
-        tools=[ReasoningTools(add_instructions=True), PDFTools()],
-        description=dedent(
-            """
-            You are part of a workflow that is designed to analyze and extract information about the insiders of a company, and synthesize those informations into a knowledge graph.
-            You are the second step of the workflow, and your task is to analyze the corporate governance report available at the URL provided by the search agent, and identify all the insiders of the company specified by the user. For each insider you have also to extract:
-            - Name
-            - Positions: 
-                - title of the position (full title, e.g., "Executive Director", "Independent Director", "Chief Executive Officer", "Chief Financial Officer", etc.)
-                - the entity the position is held in (e.g., "Board of Directors", "Audit Committee", etc.)
-                - the entity to which the insider reports based on the position ("Board of Directors", "CEO", "Stakeholders", etc.)
-                - Date of first appointment to the position
-            - Date of birth
-            - City of birth
-            - Additional information (less than 10 lines): any other relevant information about the insider that can be found in the report, such as education, experience, or other roles held within other companies.
-            """
-        ),
-        context=[
-            dedent(
-                """The reports you have to scan belongs to italian companies, usually their governance model is structured as follows:
-                - board of directors (approves the financial statements, manages the company). Is composed by directors which can be executive or non-executive, independent or not. Usually there is a chairman, a lead independent director and a president of the board of directors.
-                - board of statutory auditors (supervises the board of directors, ensures compliance with laws and regulations). Usually there is a president of the board of statutory auditors and other members. The board of statutory auditors is composed by independent members.
-                - top managers (responsible for the day-to-day management of the company). Usually there is a Chief Executive Officer (CEO), other can be Chief Financial Officer (CFO), Chief Operating Officer (COO), etc.
-                - committees (support the board of directors in specific areas, e.g. audit committee, compensation committee, etc.). Usually there is a chairman and other members.
-                - auditors (legal advisors, external auditors)."""
-            ),
-            dedent(
-                """Insiders are individuals who have access to non-public information about a company because of their position within the company. They can be:
-                - directors: members of the board of directors. The board of directors is responsible for the overall management of the company. The members of the board of directors can be executive, non-executive, independen
-                - auditors: members of the board of statutory auditors.
-                - managers: senior management roles that oversee specific departments or functions. Can be part of the board of directors.
-                - members of internal committees: usually are members of the board of directors."""
-            ),
-            dedent(
-                """Usually:
-                - president and chairman of the board of directors reports to the shareholders' meeting.
-                - directors report to the board of directors.
-                - chairman of the board of statutory auditors reports to the shareholders' meeting.
-                - auditors report to the board of statutory auditors.
-                - CEO reports to the board of directors.
-                - other managers report to the CEO or the board of directors."""
-            ),
-        ],
-        instructions=dedent(
-            """
-            Follow these instructions carefully:
-            
-            1. 📄 Use 'extraxt_text_from_url' tool to extract the content of the corporate governance report available at the URL provided by the search agent.
-            2. 🕵️‍♂️ Analyze the content to identify all individuals listed in the report as part of the company's governance structure.
-            3. 👥 Extract all the required informations about these individuals.
-            4. Return a structured response containing all extracted insiders information.
-            
-            ## Considerations:
-            - If you cannot find a specific information about an insider, you can skip that information, but try to extract as much information as possible.
-            - If no insiders are found in the report, return an empty list: [].
-            - If you cannot read the report return an empty list: [].
-            """
-        ),
+        tools=[ReasoningTools(add_instructions=True), pdf_tools],
+        description=REPORT_AGENT_DESCRIPTION,
+        context=REPORT_AGENT_CONTEXT,
+        instructions=REPORT_AGENT_INSTRUCTIONS,
         show_tool_calls=True,
         tool_call_limit=10,
         use_json_mode=True,
@@ -172,39 +126,305 @@ class TempWorkflow(Workflow):
         retries=3,
     )
 
-    def run(self, company_name: str) -> Iterator[RunResponse]:
-        report_url = None
+    def run(self, company_name: str) -> Optional[RunResponse]:
+        async def run_and_close() -> Optional[RunResponse]:
+            try:
+                return await self._run_one(company_name)
+            finally:
+                await aclose_async_client()
+
+        return asyncio.run(run_and_close())
+
+    async def arun(self, company_names: List[str]) -> AsyncIterator[RunResponse]:
+        """
+        Runs the workflow for several companies concurrently, MAX_INFLIGHT_COMPANIES at a time.
+
+        Args:
+            company_names (List[str]): The names of the companies.
+
+        Yields:
+            RunResponse: The response of each company, as soon as it completes.
+        """
+        semaphore = asyncio.Semaphore(MAX_INFLIGHT_COMPANIES)
+
+        async def run_with_semaphore(company_name: str) -> Optional[RunResponse]:
+            async with semaphore:
+                return await self._run_one(company_name)
+
+        for next_response in asyncio.as_completed(
+            [run_with_semaphore(company_name) for company_name in company_names]
+        ):
+            response = await next_response
+            if response is not None:
+                yield response
+
+    async def _run_one(self, company_name: str) -> Optional[RunResponse]:
+        """
+        Finds and analyzes the latest governance report of a company.
+
+        Each run works on its own copy of the agents, since an agent keeps the state
+        of the run in progress and companies can be processed concurrently.
+
+        Args:
+            company_name (str): The name of the company.
+
+        Returns:
+            Optional[RunResponse]: The response, or None if an agent failed.
+        """
         insiders_list = []
 
         try:
-            search_agent_output = self.search_agent.run(
-                f"Please provide the URL of the latest corporate governance report of the company {company_name}."
-            )
-
-            if not isinstance(search_agent_output.content, Report):
-                log_warning("Unexpected output type from search agent.")
-            else:
-                report_url = search_agent_output.content.url
+            report_url = await self._search_report_url(company_name)
         except Exception as e:
             log_warning(f"Error running search agent: {e}")
             return
 
-        try:
-            report_agent_output = self.report_agent.run(
-                f"Please analyze the corporate governance report available at {report_url} and extract all the insiders of the company {company_name}.",
+        # Without a report there is nothing for the report agent to read
+        if not report_url:
+            log_warning(f"No governance report found for {company_name}.")
+            return RunResponse(
+                content="completed",
             )
 
-            if not isinstance(report_agent_output.content, List[Insider]):
+        prompt = f"Please analyze the corporate governance report available at {report_url} and extract all the insiders of the company {company_name}."
+        report_text = await self._get_report_text(report_url)
+        if report_text is None:
+            report_agent = self.report_agent.deep_copy()
+        else:
+            # The text is already in the prompt, no tool round trip to read the report
+            report_agent = self.report_agent.deep_copy(
+                update={
+                    "tools": [
+                        tool
+                        for tool in self.report_agent.tools
+                        if not isinstance(tool, PDFTools)
+                    ]
+                }
+            )
+            prompt += f"\n\nThe content of the report is:\n{report_text}"
+
+        try:
+            report_agent_output = await report_agent.arun(prompt)
+
+            # List[Insider] is not a class, isinstance cannot check it
+            try:
+                insiders_list = _INSIDERS_ADAPTER.validate_python(
+                    report_agent_output.content
+                )
+            except ValidationError:
                 log_warning("Unexpected output type from report agent.")
-            else:
-                insiders_list = report_agent_output.content
         except Exception as e:
             log_warning(f"Error running report agent: {e}")
             return
 
-        for insider in insiders_list:
-            print(insider.model_dump(exclude_none=True, indent=2) + "\n")
+        # One serialization and one write for the whole list
+        if insiders_list:
+            sys.stdout.write(
+                _INSIDERS_ADAPTER.dump_json(
+                    insiders_list, exclude_none=True, indent=2
+                ).decode()
+                + "\n"
+            )
 
         return RunResponse(
             content="completed",
         )
+
+    async def run_batch(self, company_names: List[str]) -> Dict[str, List[Insider]]:
+        """
+        Runs the workflow for several companies, analyzing all the reports with a single
+        Gemini Batch API job.
+
+        The job costs half as much as the same requests sent one by one and is not
+        subject to the per-minute rate limits, but it can take minutes to complete.
+        Batch requests cannot call tools, so the reports are searched concurrently
+        and their text is extracted here, then sent in the prompts.
+
+        Args:
+            company_names (List[str]): The names of the companies.
+
+        Returns:
+            Dict[str, List[Insider]]: The insiders of each company whose report was analyzed.
+        """
+        semaphore = asyncio.Semaphore(MAX_INFLIGHT_COMPANIES)
+
+        async def get_report_text(company_name: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    report_url = await self._search_report_url(company_name)
+                except Exception as e:
+                    log_warning(f"Error running search agent for {company_name}: {e}")
+                    return None
+                if not report_url:
+                    return None
+                return await self._get_report_text(report_url)
+
+        texts = await asyncio.gather(*(get_report_text(c) for c in company_names))
+        pending = [(c, text) for c, text in zip(company_names, texts) if text]
+        if not pending:
+            return {}
+
+        model: Gemini = self.report_agent.model
+        system_message = self.report_agent.get_system_message(
+            session_id=self.report_agent.session_id or ""
+        )
+        request_params = model.get_request_params(
+            system_message=system_message.content if system_message else None
+        )
+        config = request_params["config"].model_copy(
+            update={
+                "response_mime_type": "application/json",
+                "response_schema": List[Insider],
+            }
+        )
+        requests = [
+            InlinedRequest(
+                contents=[
+                    Content(
+                        role="user",
+                        parts=[
+                            Part(
+                                text=f"Please analyze the following corporate governance report and extract all the insiders of the company {company_name}.\n\n{text}"
+                            )
+                        ],
+                    )
+                ],
+                config=config,
+            )
+            for company_name, text in pending
+        ]
+
+        client = model.get_client()
+        job = await client.aio.batches.create(model=model.id, src=requests)
+        log_debug(f"Submitted batch job {job.name} for {len(requests)} reports.")
+        job = await wait_for_batch_job(client, job)
+
+        if job.dest is None or not job.dest.inlined_responses:
+            log_warning(f"Batch job {job.name} ended in state {job.state} without responses.")
+            return {}
+
+        results: Dict[str, List[Insider]] = {}
+        for (company_name, _), inlined in zip(pending, job.dest.inlined_responses):
+            try:
+                results[company_name] = _INSIDERS_ADAPTER.validate_json(
+                    inlined.response.text
+                )
+            except Exception as e:
+                log_warning(f"Invalid batch response for {company_name}: {e}")
+        return results
+
+    async def _search_report_url(self, company_name: str) -> Optional[str]:
+        """
+        Searches the URL of the latest governance report of a company with a copy of the search agent.
+
+        Args:
+            company_name (str): The name of the company.
+
+        Returns:
+            Optional[str]: The URL of the report, or None if not found.
+        """
+        # Reports are published yearly, a URL found this month is still the latest
+        cache_path = self._get_report_url_cache_path(company_name)
+        report_url = await asyncio.to_thread(self._get_cached_report_url, cache_path)
+        if report_url is not None:
+            log_debug(f"Using cached report URL for {company_name}: {report_url}")
+            return report_url
+
+        search_agent = self.search_agent.deep_copy()
+        search_agent_output = await search_agent.arun(
+            f"Please provide the URL of the latest corporate governance report of the company {company_name}."
+        )
+
+        if not isinstance(search_agent_output.content, Report):
+            log_warning("Unexpected output type from search agent.")
+            return None
+        report_url = search_agent_output.content.url
+        if report_url:
+            await asyncio.to_thread(self._cache_report_url, cache_path, report_url)
+        return report_url
+
+    async def _get_report_text(self, report_url: str) -> Optional[str]:
+        """
+        Returns the text of a report, from the cache when the file did not change.
+
+        The text is the one the report agent's PDF tool returns. It is cached under the URL
+        and the Content-Length, ETag and Last-Modified headers of the file.
+
+        Args:
+            report_url (str): The URL of the report.
+
+        Returns:
+            Optional[str]: The text of the report, or None if it could not be extracted.
+        """
+        try:
+            response = await get_async_client().head(report_url, timeout=10.0)
+            validators = [
+                response.headers.get(name, "")
+                for name in ("content-length", "etag", "last-modified")
+            ]
+        except Exception as e:
+            log_debug(f"HEAD request failed for {report_url}: {e}")
+            validators = []
+        key = "\0".join([report_url, *validators])
+        cache_path = os.path.join(
+            REPORT_TEXT_CACHE_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.txt"
+        )
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                log_debug(f"Using cached text for report at {report_url}")
+                return f.read()
+        except OSError:
+            pass
+
+        # The tool runs on its own event loop, together with its browser
+        text = await asyncio.to_thread(self.pdf_tools.get_pdf_content, report_url)
+        # Failures come back as a message instead of the report content
+        if not text.startswith("### PDF Content ###"):
+            return None
+
+        try:
+            os.makedirs(REPORT_TEXT_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            log_warning(f"Unable to cache report text: {e}")
+        return text
+
+    def _get_report_url_cache_path(self, company_name: str) -> str:
+        month = datetime.now(timezone.utc).strftime("%Y-%m")
+        key = f"{' '.join(company_name.casefold().split())}:{month}"
+        return os.path.join(
+            REPORT_URL_CACHE_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        )
+
+    def _get_cached_report_url(self, cache_path: str) -> Optional[str]:
+        """
+        Returns the cached report URL.
+
+        Args:
+            cache_path (str): The path of the cache entry.
+
+        Returns:
+            Optional[str]: The cached URL, or None on a miss.
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                return from_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _cache_report_url(self, cache_path: str, report_url: str) -> None:
+        """
+        Stores a report URL.
+
+        Args:
+            cache_path (str): The path of the cache entry.
+            report_url (str): The URL to cache.
+        """
+        try:
+            os.makedirs(REPORT_URL_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(to_json(report_url))
+        except OSError as e:
+            log_warning(f"Unable to cache report URL: {e}")